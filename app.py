@@ -4,14 +4,695 @@ import streamlit as st
 from pathlib import Path
 import time
 from streamlit_echarts import st_echarts
-import uuid
 from streamlit_extras.stylable_container import stylable_container
 import numpy as np
+import pandas as pd
 import src.sensor_data as sensor_data
-from scipy import stats
 import csv
-import os
+import functools
+import threading
+from types import MappingProxyType
+
+
+# Layout structure for the grid of room buttons on the floor plan as (row, column spec) pairs.
+# Each row is assigned a set of Streamlit columns, which determine how buttons are arranged;
+# the rows are rendered in this order, the single-column rows act as vertical spacers.
+_ROWS_LAYOUT = (
+    (0, 1),
+    (10, 1),
+    (1, [2, 2, 2, 2, 1, 8]),  # Custom column width distribution for row 1
+    (9, 1),
+    (2, 6),  # Row with 6 evenly spaced columns
+    (3, [2, 3, 2, 2, 3, 4]),  # Uneven column widths for layout adjustments
+    (4, [2, 3, 2, 2, 4, 3]),
+    (5, 1),
+    (6, 1),
+    (7, 1),
+    (8, 1),
+)
+
+# Mapping of sensor names to their respective row and column positions in the grid
+_ROOM_COORDINATES = MappingProxyType({
+    "multisensor_115": (1, 1),
+    "multisensor_108": (1, 2),
+    "multisensor_107": (1, 3),
+    "multisensor_114": (1, 4),
+    "multisensor_110": (1, 5),
+    "multisensor_109": (1, 6),
+    "multisensor_104": (3, 6),
+    "multisensor_106": (4, 5),
+    "multisensor_111": (4, 3),
+    "multisensor_103": (4, 4),
+    "multisensor_113": (3, 1),
+    "multisensor_112": (2, 2),
+    "multisensor_105": (3, 5),
+})
+
+# Warning thresholds and messages for the different sensors
+_WARNINGS = MappingProxyType({
+    "Temperature": {
+        "too_low": (18, "It's too cold to concentrate. Consider turning up the heat."),
+        "too_high": (26, "It's too hot to concentrate. Consider opening a window."),
+    },
+    "Humidity": {
+        "too_low": (30, "The air is too dry. Consider increasing ventilation or opening a window."),
+        "too_high": (60, "The air is too humid. Consider opening a window."),
+    },
+    "CO2": {
+        "too_high": (1000, "CO2 levels are high. Open a window for fresh air."),
+    },
+    "IAQ": {
+        "too_high": (100, "Indoor Air Quality is poor. Consider increasing ventilation or opening a window."),
+    },
+    "UV Index": {
+        "too_high": (6, "UV Index is high. Consider closing the blinds or staying out of direct sunlight."),
+    },
+    "Microphone Noise Level": {
+        "too_high": (80, "Noise levels are high. Consider reducing the noise or moving to a quieter space."),
+    },
+    "Pressure": {
+        "too_low": (980, "Atmospheric pressure is low. It might feel stuffy. Consider opening a window."),
+        "too_high": (1030, "Atmospheric pressure is high. Consider opening a window to ventilate the room."),
+    },
+    "Light": {
+        "too_low": (50, "Light levels are too low. Consider turning on more lights."),
+        "too_high": (1000, "Light levels are too bright. Consider adjusting the lighting."),
+    },
+    "Gas Resistance": {
+        "too_high": (1000, "Gas resistance is high. Open a window or ventilate the room."),
+    },
+    "Occupancy": {
+        "too_high": (10, "Too many people in the room. Consider moving to a less crowded room."),
+    },
+})
+
+
+def _sensor_limits(warnings):
+    """
+    Flattens the warning definitions of one sensor into a single lookup entry.
+
+    Parameters:
+    - warnings (dict): The "too_low"/"too_high" entries of `_WARNINGS` for the sensor.
+
+    Returns:
+    - tuple: (low, high, too_low_message, too_high_message); a missing bound is -inf/inf so that
+      it never triggers and the check needs no membership tests.
+    """
+    low, too_low_message = warnings.get("too_low", (float("-inf"), None))
+    high, too_high_message = warnings.get("too_high", (float("inf"), None))
+    return low, high, too_low_message, too_high_message
+
+
+# Thresholds and messages of `_WARNINGS` as (low, high, too_low_message, too_high_message) per sensor
+_SENSOR_LIMITS = MappingProxyType({sensor: _sensor_limits(warnings) for sensor, warnings in _WARNINGS.items()})
+
+# Ideal values for the different sensors
+_IDEAL_VALUES = MappingProxyType({
+    "Temperature": 21,
+    "Humidity": 45,
+    "CO2": 400,
+    "IAQ": 50,
+    "UV Index": 0,
+    "Microphone Noise Level": 40,
+    "Pressure": 1013,
+    "Light": 400,
+    "Gas Resistance": 200,
+    "Occupancy": 1,
+})
+
+# Optimal range for the different sensors
+_SENSOR_RANGES = MappingProxyType({
+    "Temperature": (18, 26),
+    "Humidity": (30, 60),
+    "CO2": (0, 1000),
+    "IAQ": (0, 100),
+    "UV Index": (0, 6),
+    "Microphone Noise Level": (0, 80),
+    "Pressure": (980, 1030),
+    "Light": (50, 1000),
+    "Gas Resistance": (0, 1000),
+    "Occupancy": (0, 10),
+})
+
+
+def _range_bounds(good_range):
+    """
+    Calculates the scale of the gauge chart for an optimal range.
+
+    The gauge extends the optimal range by its own width on both sides (but never below 0),
+    rounded to the nearest 10. The orange "warning" block is 1/4th of the optimal range.
+
+    Returns:
+        tuple: (min_value, max_value, orange_block_size)
+    """
+    low, high = good_range
+    min_value = max(low - (high - low), 0)
+    max_value = high + (high - low)
+    return round(min_value / 10) * 10, round(max_value / 10) * 10, round((high - low) / 4)
+
+
+# Gauge scale (min_value, max_value, orange_block_size) for the different sensors
+_SENSOR_RANGE_BOUNDS = MappingProxyType({sensor: _range_bounds(good_range)
+                                         for sensor, good_range in _SENSOR_RANGES.items()})
+
+
+# Descriptions of sensor concentration impact shown in the sensor tabs
+_SENSOR_DESC_CONCENTRATION = {
+    "Temperature": """
+        Temperature plays a crucial role in human concentration and cognitive performance. Studies show that higher temperatures can lead to increased fatigue, dehydration, and reduced mental clarity, while colder environments often result in physical discomfort, increased energy expenditure, and diminished focus. Maintaining an optimal room temperature of around 20-22°C is critical for ensuring comfort, mental sharpness, and productivity.
+        """,
+
+    "Humidity": """
+        High humidity can increase discomfort by impairing the body’s ability to cool itself, while low humidity can dry out 
+        mucous membranes, causing irritation. Maintaining an indoor humidity level between 40–60% supports comfort, 
+        respiratory health, and focus.
+        """,
+
+    "CO2": """
+        Elevated CO2 levels (above 1000 ppm) can impair cognitive function, causing fatigue, headaches, and reduced alertness. 
+        Maintaining CO2 levels below 800 ppm is optimal for productivity and well-being.
+        """,
+
+    "IAQ": """
+        Poor air quality can lead to respiratory irritation, headaches, and reduced cognitive performance. 
+        Monitoring IAQ helps ensure a healthier, more productive environment by managing indoor pollutants.
+        """,
+
+    "UV Index": """
+        Prolonged exposure to high UV levels can cause skin damage, eye strain, and increase the risk of skin cancer. 
+        Monitoring UV levels helps reduce harmful exposure, ensuring health and focus.
+        """,
+
+    "Microphone Noise Level": """
+        High noise levels can disrupt concentration, increase stress, and impair communication. 
+        Prolonged exposure to noise above 70 dB may lead to fatigue and decreased productivity.
+        """,
+
+    "Pressure": """
+        Pressure fluctuations can cause discomfort, headaches, and fatigue, especially for those sensitive to weather changes. 
+        Stable pressure is ideal for comfort and focus.
+        """,
+
+    "Light": """
+        Inadequate lighting can cause eye strain and fatigue, reducing concentration. 
+        Proper lighting, with a temperature between 4000–5000 K, enhances alertness and focus.
+        """,
+
+    "Gas Resistance": """
+        Exposure to harmful gases can cause respiratory issues, headaches, and long-term health risks. 
+        Monitoring gas concentrations ensures safety and maintains good air quality.
+        """,
+}
+
+# Descriptions of how sensors measure the data
+_SENSOR_DESC_DETAIL = {
+    "Temperature": """
+        The BME680 and SCD30 sensors work together to provide an accurate, combined temperature reading. The BME680 uses an integrated thermistor to measure ambient temperature by detecting resistance changes as heat energy fluctuates. The SCD30 adds further precision by incorporating a Kalman-filtered combination of both sensors’ data, ensuring stable and reliable temperature readings. This fusion of data ensures highly accurate temperature monitoring, contributing to a more comfortable and productive environment.
+        """,
+    "Humidity": """
+        The BME680 and SCD30 sensors work together to measure relative humidity accurately. The BME680 uses a capacitive humidity sensor that detects changes in capacitance as the polymer film absorbs water molecules, while the SCD30 sensor uses a similar capacitive approach to detect humidity levels. These sensors’ data are combined through a Kalman filter, providing a reliable and stable humidity measurement that helps create an optimal environment for focus and comfort.
+        """,
+
+    "CO2": """
+        The SCD30 sensor uses nondispersive infrared (NDIR) technology to measure CO2 concentration. It emits infrared light and measures the absorption by CO2 molecules to provide an accurate reading.
+        """,
+
+    "IAQ": """
+        The BME680 sensor assesses indoor air quality by detecting volatile organic compounds (VOCs) and other gaseous pollutants. It uses a metal-oxide semiconductor that reacts with gases, changing its conductivity to generate an air quality index.
+        """,
+
+    "UV Index": """
+        The LTR390 sensor measures ultraviolet (UV) radiation intensity with photodiodes sensitive to UV wavelengths. It provides accurate data on UV levels, enabling UV index calculation.
+        """,
+
+    "Microphone Noise Level": """
+        The MAX4466 sensor detects sound levels by measuring pressure changes in sound waves, converting them into an electrical signal. 
+        """,
+
+    "Pressure": """
+        The BME680 sensor measures atmospheric pressure using a piezoresistive sensor, which detects pressure changes 
+        based on diaphragm deformation and converts this into an electrical signal.
+        """,
+
+    "Light": """
+        The LTR390 sensor measures light intensity using photodiodes, and the APDS-9960 sensor detects light temperature, 
+        proximity, and color to monitor ambient lighting conditions.
+        """,
+
+    "Gas Resistance": """
+        The MICS-6814 sensor detects gases like ammonia (NH3), carbon monoxide (CO), and nitrogen dioxide (NO2) 
+        using metal-oxide semiconductors that change resistance in response to gas molecules.
+        """,
+}
+
+# Trim the descriptions once at import instead of on every display
+_SENSOR_DESC_CONCENTRATION = MappingProxyType({sensor: text.strip()
+                                               for sensor, text in _SENSOR_DESC_CONCENTRATION.items()})
+_SENSOR_DESC_DETAIL = MappingProxyType({sensor: text.strip() for sensor, text in _SENSOR_DESC_DETAIL.items()})
+
+
+def _time_labels(times):
+    """
+    Formats timestamps as "HH:MM Uhr" x-axis labels with vectorized NumPy string operations.
+
+    Parameters:
+    - times (array-like of datetime or datetime64): The timestamps to format.
+
+    Returns:
+    - numpy.ndarray of str: One label per timestamp.
+    """
+    iso_minutes = np.datetime_as_string(np.asarray(times, dtype="datetime64[m]"), unit="m")  # YYYY-MM-DDTHH:MM
+    return np.char.add(np.char.partition(iso_minutes, "T")[..., 2], " Uhr")
+
+
+def _fit_line(x, y):
+    """
+    Fits straight lines y = slope * x + intercept with ordinary least squares.
+
+    The reductions run along the last axis, so the same kernel fits a single series (shape (N,))
+    or a batch of equally long series stacked into a matrix (shape (S, N)) in one call.
+
+    Parameters:
+    - x (numpy.ndarray of float): The x values, e.g. seconds since the first timestamp.
+    - y (numpy.ndarray of float): The y values, same shape as x.
+
+    Returns:
+    - slope, intercept: Scalars for a single series, arrays of length S for a batch. A series whose
+      x values are all equal (e.g. a single sample) gets slope 0 and its mean as intercept.
+    """
+    x_mean = x.mean(axis=-1, keepdims=True)
+    y_mean = y.mean(axis=-1, keepdims=True)
+    x_centered = x - x_mean
+    sxy = (x_centered * (y - y_mean)).sum(axis=-1)
+    sxx = (x_centered * x_centered).sum(axis=-1)
+    # Guard the degenerate case instead of producing NaN predictions (and a RuntimeWarning)
+    slope = np.divide(sxy, sxx, out=np.zeros_like(sxy), where=sxx != 0)[()]  # [()] unwraps the 0-d case
+    intercept = y_mean[..., 0] - slope * x_mean[..., 0]
+    return slope, intercept
+
+
+# Sensors whose prediction is not cut at the last turning point (noisy or step-like signals)
+_NO_TURNING_POINT_SENSORS = frozenset({"Microphone Noise Level", "Occupancy", "Light"})
+
+# Sensors whose panel shows no prognosis, so no prediction is computed for them
+_NO_PREDICTION_SENSORS = frozenset({"Occupancy"})
+
+# Offsets of the prediction grid from the current quarter hour: 25 steps of 15 minutes (6 hours ahead),
+# as timedeltas for the displayed times and as seconds for the regression
+_FUTURE_OFFSETS = tuple(timedelta(minutes=15 * i) for i in range(25))
+_FUTURE_OFFSET_SECONDS = np.array([offset.total_seconds() for offset in _FUTURE_OFFSETS])
+_FUTURE_OFFSET_SECONDS.flags.writeable = False
+
+
+@st.cache_data(ttl=900, max_entries=256, show_spinner=False)
+def _predict_data(sensor, timestamps, values, nearest_quarter_hour):
+    """
+    Fits the regression for `Dashboard.predict_data` and evaluates it on the 15-minute prediction grid.
+
+    Cached across reruns and sessions: the arguments only change when a new sample arrives or the
+    grid moves on to the next quarter hour, and the TTL matches the grid spacing.
+
+    Returns:
+        tuple: (future_times, predictions), see `Dashboard.predict_data`
+    """
+    # Case 1: Use only the last two hours of data (the history is time-ordered, so a binary search
+    # finds the start of the window)
+    two_hours_ago = timestamps[-1] - np.timedelta64(2, "h")
+    start = np.searchsorted(timestamps, two_hours_ago, side="left")
+
+    # Special case for Light sensor, where all historical data is used
+    if sensor == "Light":
+        start = 0
 
+    # Case 2: Use data from the last significant turning point (local maxima or minima)
+    if sensor not in _NO_TURNING_POINT_SENSORS:  # Ignore for certain sensors
+        # A strict local extremum at i is where the step into i and the step out of i have opposite signs
+        steps = np.sign(np.diff(values))
+        turning_points = np.flatnonzero(steps[:-1] * steps[1:] < 0)
+        # If a turning point is found, the data starts from the latest one
+        if turning_points.size:
+            start = turning_points[-1] + 1
+
+    # Extract the recent timestamps and values (a single slice of each array)
+    recent_timestamps = timestamps[start:]
+    recent_values = values[start:]
+
+    # Prepare data for regression (time in seconds from the first timestamp)
+    time_numbers = (recent_timestamps - recent_timestamps[0]) / np.timedelta64(1, "s")
+
+    # Perform linear regression (ordinary least squares, only slope and intercept are needed)
+    slope, intercept = _fit_line(time_numbers, recent_values)
+
+    # Generate future times in 15-minute intervals (next 6 hours) for the x-axis of the graphs
+    future_times = [nearest_quarter_hour + offset for offset in _FUTURE_OFFSETS]  # 6 hours ahead
+
+    # Prepare future time data for prediction (seconds since the first timestamp): the grid starts at
+    # the quarter hour and advances by 900 s, so the offsets follow directly from the first one
+    base_offset = (np.datetime64(nearest_quarter_hour, "us") - recent_timestamps[0]) / np.timedelta64(1, "s")
+    future_time_numbers = base_offset + _FUTURE_OFFSET_SECONDS
+
+    # Use the regression model to predict future values, setting negative predictions to 0
+    # (e.g., if sensor values can't be negative)
+    predictions = np.maximum(0, slope * future_time_numbers + intercept).tolist()
+
+    # Return the predicted future times and values
+    return future_times, predictions
+
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _combined_graph_options(sensor, unit, timestamps, values, future_times, predictions):
+    """
+    Builds the ECharts options of `Dashboard.display_combined_graph`.
+
+    Cached on the (NumPy) series, so reruns without new data reuse the options instead of
+    formatting the labels and assembling the dict again.
+
+    Returns:
+        dict: The ECharts options.
+    """
+    # Combine the historical and prognosis timestamps and format the x-axis as hour:minute in one pass
+    x_axis_combined = _time_labels(np.concatenate((timestamps, future_times))).tolist()  # Combined x-axis data
+
+    # Key each series by its x-axis index instead of padding it with None: the historical data
+    # covers the first len(values) categories, the prognosis data the ones after it. The indexes
+    # stay ints (stacking them with the values in NumPy would turn them into floats).
+    n_historical = len(values)
+    combined_historical_data = [[i, v] for i, v in enumerate(values.tolist())]
+    # The regression output is rounded to the displayed precision to keep the JSON payload small
+    combined_prognosis_data = [[i, v] for i, v in enumerate(np.round(predictions, 2).tolist(), n_historical)]
+
+    # ECharts options for the combined graph
+    return {
+        "tooltip": {"trigger": "axis"},  # Tooltip on hover, displaying data on the axis
+        "xAxis": {
+            "type": "category",  # X-axis is categorical (time intervals)
+            "data": x_axis_combined,  # X-axis data (combined historical and prognosis)
+            "name": "Time",  # Label for the X-axis
+        },
+        "yAxis": {
+            "type": "value",  # Y-axis represents numerical values
+            "name": sensor,  # Label for the Y-axis (sensor name)
+        },
+        "series": [
+            {
+                "data": combined_historical_data,  # Historical data points as (x index, value)
+                "type": "line",  # Line graph for historical data
+                "smooth": True,  # Smooth the line curve
+                "name": f"Historical: {sensor} ({unit})",  # Label for the historical data series
+                "lineStyle": {"type": "solid"}  # Solid line style for historical data
+            },
+            {
+                "data": combined_prognosis_data,  # Prognosis data points as (x index, value)
+                "type": "line",  # Line graph for prognosis data
+                "smooth": True,  # Smooth the line curve
+                "name": f"Prognosis: {sensor} ({unit})",  # Label for the prognosis data series
+                "lineStyle": {"type": "dashed"}  # Dashed line style for prognosis data
+            }
+        ],
+        "legend": {
+            "data": [f"Historical: {sensor} ({unit})", f"Prognosis: {sensor} ({unit})"]
+            # Legend labels for the data series
+        },
+        "dataZoom": [  # Zoom controls for the graph
+            {"type": "slider", "start": 0, "end": 100},  # Slider zoom control for x-axis
+            {"type": "inside"}  # Enables zooming inside the graph
+        ],
+    }
+
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _historical_graph_options(sensor, unit, timestamps, values):
+    """
+    Builds the ECharts options of `Dashboard.display_historical_graph` (cached like `_combined_graph_options`).
+
+    Returns:
+        dict: The ECharts options.
+    """
+    # Prepare historical data for the x-axis (formatted as hour:minute, in one vectorized pass)
+    x_axis_historical = _time_labels(timestamps).tolist()
+
+    # Historical data series configuration for the line chart
+    historical_series = {
+        "data": values.tolist(),  # The actual historical values to be plotted
+        "type": "line",  # Line chart type
+        "smooth": True,  # Smooth the curve of the line
+        "name": f"{sensor} ({unit})"  # Label for the line
+    }
+
+    # ECharts options for displaying the historical data
+    return {
+        "title": {"text": f"Historical Data"},  # Title of the chart
+        "tooltip": {"trigger": "axis"},  # Tooltip on hover over data points
+        "xAxis": {
+            "type": "category",  # X-axis is categorical (time intervals)
+            "data": x_axis_historical,  # Data for the x-axis (time)
+            "name": "Time"  # Label for the X-axis
+        },
+        "yAxis": {
+            "type": "value",  # Y-axis represents numerical values
+            "name": sensor  # Label for the Y-axis (sensor name)
+        },
+        "series": historical_series,  # Data series (historical values)
+        "legend": {
+            "data": [historical_series["name"]]  # Legend label for the historical data series
+        },
+        "dataZoom": [  # Zoom controls for the graph
+            {"type": "slider", "start": 0, "end": 100},  # Slider zoom control for x-axis
+            {"type": "inside"}  # Enables zooming inside the graph
+        ],
+    }
+
+
+@st.cache_data(ttl=60, max_entries=256, show_spinner=False)
+def _future_graph_options(sensor, unit, future_times, predictions):
+    """
+    Builds the ECharts options of `Dashboard.display_future_graph` (cached like `_combined_graph_options`).
+
+    Returns:
+        dict: The ECharts options.
+    """
+    # Prepare the x-axis labels (times in HH:MM format, in one vectorized pass)
+    x_axis_prognosis = _time_labels(future_times).tolist()
+
+    # Prepare the series data for the prognosis line (rounded to the displayed precision)
+    prognosis_series = {
+        "data": np.round(predictions, 2).tolist(),
+        "type": "line",
+        "smooth": True,
+        "name": f"Prognosis: {sensor} ({unit})",
+        "lineStyle": {"type": "dashed"}
+    }
+
+    # ECharts options for rendering the prognosis graph
+    return {
+        "title": {"text": f"Prognosis"},
+        "tooltip": {"trigger": "axis"},
+        "xAxis": {"type": "category", "data": x_axis_prognosis, "name": "Time"},
+        "yAxis": {"type": "value", "name": sensor},
+        "series": prognosis_series,
+        "legend": {"data": prognosis_series["name"]},
+        "dataZoom": [
+            {"type": "slider", "start": 0, "end": 100},
+            {"type": "inside"}
+        ],
+    }
+
+
+def _check_for_warnings(sensor, value, unit):
+    """
+    Evaluates a sensor value against the thresholds in `_SENSOR_LIMITS` (see `Dashboard.check_for_warnings`).
+
+    Use it through `_get_warning_checker()`, which memoizes the results.
+
+    Returns:
+        tuple: (message, True if the value is within a comfortable range)
+    """
+
+    # Convert the value once; a value that is unknown (or missing) has no current reading
+    try:
+        v = float(value)
+    except (TypeError, ValueError):
+        return f"{sensor} has no current value.", True
+
+    # Check if the sensor has predefined thresholds (a missing bound never triggers)
+    limits = _SENSOR_LIMITS.get(sensor)
+    if limits is not None:
+        low, high, too_low_message, too_high_message = limits
+
+        # Check for low-value warnings
+        if v < low:
+            return too_low_message, False
+
+        # Check for high-value warnings
+        if v > high:
+            return too_high_message, False
+
+    # If no warnings are triggered, return a message indicating normal conditions
+    return f"{sensor} value is within a comfortable range.", True
+
+
+@st.cache_resource
+def _get_warning_checker():
+    """
+    Returns the memoized `_check_for_warnings` shared by all reruns and sessions.
+
+    The results are pure functions of (sensor, value, unit), so a plain `functools.lru_cache`
+    hit replaces the comparisons without the hashing and pickling of `st.cache_data`. It is
+    created through `st.cache_resource` because app.py itself is re-executed on every rerun.
+    """
+    return functools.lru_cache(maxsize=512)(_check_for_warnings)
+
+
+@st.cache_resource
+def _gauge_series_template(sensor, unit):
+    """
+    Builds the static part of the gauge chart series for a sensor (scale, color stops and formatter).
+
+    The template only depends on the sensor and its unit, so it is built once per process.
+    The returned dict is shared across reruns and must not be modified.
+    """
+
+    # Retrieve the good range and the precomputed gauge scale for the selected sensor.
+    good_range = _SENSOR_RANGES[sensor]
+    min_value, max_value, orange_block_size = _SENSOR_RANGE_BOUNDS[sensor]
+
+    # Helper function to normalize the sensor value for the gauge chart.
+    def normalize_value(value):
+        """Normalizes a given sensor value to a 0-1 range for the gauge chart."""
+        nv = (value - min_value) / (max_value - min_value)
+        return round(nv, 2)
+
+    return {
+        "type": "gauge",  # Using gauge chart type.
+        "startAngle": 180,  # Start angle for the gauge.
+        "endAngle": 0,  # End angle for the gauge.
+        "min": min_value,  # Minimum value for the gauge.
+        "max": max_value,  # Maximum value for the gauge.
+        "splitNumber": 5,  # Number of divisions in the gauge.
+        "axisLine": {
+            "lineStyle": {
+                "width": 10,  # Width of the gauge line.
+                "color": [
+                    [normalize_value(good_range[0] - orange_block_size), "#ffb7ac"],  # Red (Too Low)
+                    [normalize_value(good_range[0]), "#f9f8ab"],  # Orange (Warning)
+                    [normalize_value(good_range[1]), "#d4ffce"],  # Green (Optimal)
+                    [normalize_value(good_range[1] + orange_block_size), "#f9f8ab"],  # Orange (Warning)
+                    [normalize_value(max_value), "#ffb7ac"],  # Red (Too High)
+                ],
+            }
+        },
+        "pointer": {
+            "length": "60%",  # Pointer length in the gauge.
+            "itemStyle": {
+                "color": 'auto'  # Auto color for the pointer.
+            }
+        },
+        "detail": {"formatter": "{value} " + unit},  # Formatting the displayed value with the unit.
+    }
+
+
+# Color of a metric's delta by (sign of value - ideal value, sign of delta), all other combinations are "off":
+# a value below the ideal that keeps falling is "normal", a value above the ideal that keeps rising is "inverse"
+_DELTA_COLOR = MappingProxyType({(-1, -1): "normal", (1, 1): "inverse"})
+
+
+def _delta_color(value, ideal, delta):
+    """Looks up the Streamlit delta color for a metric value compared to its ideal value."""
+    return _DELTA_COLOR.get(((value > ideal) - (value < ideal), (delta > 0) - (delta < 0)), "off")
+
+
+_MEDIA_DIR = Path(__file__).parent / "media"
+# Logo path as a string to ensure compatibility with st.logo
+_LOGO_PATH = str(_MEDIA_DIR / "zeki_logo.png")
+
+
+@st.cache_resource
+def _page_style_css():
+    """
+    Builds the page CSS with the 3D room plan embedded as a base64 background image.
+
+    The floorplan is read and encoded once per process instead of on every rerun, and all rules
+    share one `<style>` block so the page only needs a single markdown element.
+
+    Returns:
+        str: The `<style>` block for `Dashboard.set_page_style`.
+    """
+    # Read and encode the image as base64 to be used in the background
+    bin_str = base64.b64encode((_MEDIA_DIR / "ZEKI-Floorplan-1536x640.png").read_bytes()).decode()
+
+    # Define custom CSS for background image and layout
+    return f"""
+        <style>
+        /* Set the background image for the entire Streamlit app container */
+        .stMainBlockContainer {{
+            max-width: 95%; /* Limit content width to 95% of the screen */
+            background-image: url("data:image/png;base64,{bin_str}");
+            background-size: 105% 500px;  /* Ensure the image covers the container */
+            background-repeat: no-repeat;  /* Prevent the image from repeating */
+            background-position: center calc(190px);  /* Position the background image */
+        }}
+        .stMainMenu {{visibility: hidden}}  /* Hide the default menu */
+        #MainMenu {{visibility: hidden;}}
+        </style>
+        """
+
+
+# Delay between two streamed words of the sensor descriptions (decorative typewriter effect,
+# but it holds the server thread for the whole text)
+_STREAM_WORD_DELAY = 0.005
+
+
+@st.cache_data(show_spinner=False)
+def _stream_words(text):
+    """
+    Splits a description into the chunks streamed by `Dashboard.stream_sensor_info`.
+
+    Whitespace runs (indentation and line breaks of the triple-quoted descriptions) collapse into
+    a single space, and each word already carries its trailing space.
+
+    Returns:
+        tuple: The words of the text, each followed by a space.
+    """
+    return tuple(word + " " for word in text.split())
+
+
+class _TrainingDataFile:
+    """
+    Appends rows of training data to the CSV file.
+
+    Every row is written (and the file closed) before `append` returns, so a row
+    reported as saved is on disk. Whether the file still needs its header is only
+    checked once instead of on every submitted row.
+    """
+
+    header = ['CO2', 'Temperature', 'Humidity', 'IAQ', 'Noise_Level', 'Pressure', 'Light_Level',
+              'Gas_Resistance', 'Room_Volume', 'Datetime', 'Label']
+
+    def __init__(self, path):
+        self.path = path
+        self.header_written = None  # Unknown until the first write
+        self.lock = threading.Lock()  # Streamlit sessions run in separate threads
+
+    def append(self, row):
+        """Appends a row to the CSV file, preceded by the header if the file is still empty."""
+        with self.lock:
+            # Only stat the file once to find out whether the header is still missing
+            if self.header_written is None:
+                self.header_written = self.path.exists() and self.path.stat().st_size > 0
+
+            # Open the file in append mode
+            with open(self.path, mode='a', newline='') as file:
+                writer = csv.writer(file)
+                if not self.header_written:
+                    writer.writerow(self.header)
+                    self.header_written = True
+                writer.writerow(row)
+
+
+@st.cache_resource
+def _get_training_data_file():
+    """Returns the training data file shared by all sessions and reruns."""
+    return _TrainingDataFile(Path(__file__).parent / "training_data" / "training_data.csv")
 
 
 class Dashboard:
@@ -49,7 +730,7 @@ class Dashboard:
             predict_data(room, sensor, unit, timestamps, values):
                 Predicts future sensor values using linear regression based on historical data.
 
-            display_historyic_graph(room, sensor, unit, timestamps, values):
+            display_historical_graph(room, sensor, unit, timestamps, values):
                 Plots historical sensor data.
 
             show_sensor_gauge(sensor, unit, current_value):
@@ -90,46 +771,13 @@ class Dashboard:
 
         Behavior:
         ---------
-        - Uses a predefined layout (`rows_layout`) to organize buttons into rows and columns.
-        - The `room_coordinates` dictionary maps sensor names to specific grid positions.
+        - Uses a predefined layout (`_ROWS_LAYOUT`) to organize buttons into rows and columns.
+        - The `_ROOM_COORDINATES` mapping maps sensor names to specific grid positions.
         - Clicking a button updates `st.session_state.selected_room` and `st.session_state.selected_sensor`.
         - The button tooltip displays the current sensor value and its unit.
 
         """
 
-        # Define the layout structure for the grid (rows with columns)
-        # Each row is assigned a set of Streamlit columns, which determine how buttons are arranged.
-        rows_layout = {
-            0: st.columns(1),
-            10: st.columns(1),
-            1: st.columns([2, 2, 2, 2, 1, 8]),  # Custom column width distribution for row 1
-            9: st.columns(1),
-            2: st.columns(6),  # Row with 6 evenly spaced columns
-            3: st.columns([2, 3, 2, 2, 3, 4]),  # Uneven column widths for layout adjustments
-            4: st.columns([2, 3, 2, 2, 4, 3]),
-            5: st.columns(1),
-            6: st.columns(1),
-            7: st.columns(1),
-            8: st.columns(1),
-        }
-
-        # Mapping of sensor names to their respective row and column positions in the grid
-        self.room_coordinates = {
-            "multisensor_115": (1, 1),
-            "multisensor_108": (1, 2),
-            "multisensor_107": (1, 3),
-            "multisensor_114": (1, 4),
-            "multisensor_110": (1, 5),
-            "multisensor_109": (1, 6),
-            "multisensor_104": (3, 6),
-            "multisensor_106": (4, 5),
-            "multisensor_111": (4, 3),
-            "multisensor_103": (4, 4),
-            "multisensor_113": (3, 1),
-            "multisensor_112": (2, 2),
-            "multisensor_105": (3, 5),
-        }
-
         def handler(*args, **kwargs):
             """
             Handles button clicks by updating session state variables
@@ -140,15 +788,24 @@ class Dashboard:
             st.session_state.selected_room = room_id
             st.session_state.selected_sensor = sensor  # Store the selected sensor in session state
 
-        # Loop through each room's assigned position
-        for room_id, (row, col) in self.room_coordinates.items():
-            if row in rows_layout:
-                # Get the column object (col - 1 because lists are 0-indexed)
-                column = rows_layout[row][col - 1]
-                with column:
-                    # Create three columns inside the selected grid column to center the button
-                    col1, col2, col3 = st.columns([1, 1, 1])
-                    with col2:  # Place the button in the center column
+        # Wrap the grid in one styled container that centers every button in its grid column
+        with stylable_container(
+                key=f"room_buttons_{sensor.replace(' ', '_')}",
+                css_styles="""
+                div[data-testid="stButton"] {
+                    text-align: center;
+                }
+                """,
+        ):
+            # Create the grid columns from the layout spec (Streamlit needs fresh columns on every run)
+            rows_layout = {row: st.columns(spec) for row, spec in _ROWS_LAYOUT}
+
+            # Loop through each room's assigned position
+            for room_id, (row, col) in _ROOM_COORDINATES.items():
+                if row in rows_layout:
+                    # Get the column object (col - 1 because lists are 0-indexed)
+                    column = rows_layout[row][col - 1]
+                    with column:
                         # Retrieve the sensor's current value and unit from data
                         value = self.data[room_id]["sensors"][sensor]["current_value"]
                         unit = self.data[room_id]["sensors"][sensor]["unit"]
@@ -156,7 +813,7 @@ class Dashboard:
                         # Create an interactive button with a tooltip showing sensor data
                         st.button("📍️",
                                   help=f"{value} {unit}",  # Tooltip displaying sensor value and unit
-                                  key=uuid.uuid4(),  # Generate a unique key for each button
+                                  key=f"btn_{room_id}_{sensor}",  # Stable key, unique per room and sensor tab
                                   on_click=handler,  # Call handler function on click
                                   args=(room_id, sensor))  # Pass room_id and sensor to handler
 
@@ -165,14 +822,15 @@ class Dashboard:
         Evaluates the given sensor value and determines if a warning message should be issued.
 
         This function compares the sensor's value against predefined thresholds and returns an
-        appropriate message if the value falls outside a comfortable range.
+        appropriate message if the value falls outside a comfortable range. The result is a pure
+        function of its arguments and is memoized by `_get_warning_checker`.
 
         Parameters:
         -----------
         sensor : str
             The name of the sensor being evaluated (e.g., "Temperature", "Humidity", "CO2").
-        value : str or float
-            The current value of the sensor. If the value is 'unknown', a message will be returned.
+        value : str, float or None
+            The current value of the sensor. If the value is 'unknown' or None, a message will be returned.
         unit : str
             The unit of measurement associated with the sensor value (e.g., "°C", "%", "ppm").
 
@@ -184,67 +842,15 @@ class Dashboard:
 
         Behavior:
         ---------
-        - The function checks if the sensor is present in the predefined `warnings` dictionary.
+        - The function checks if the sensor is present in the predefined `_SENSOR_LIMITS` table.
         - If the sensor has thresholds for "too_low" or "too_high", the function evaluates whether the value
           is outside the safe range and returns the corresponding warning.
-        - If the value is 'unknown', it returns a message indicating the sensor has no current reading.
+        - If the value is 'unknown' or None, it returns a message indicating the sensor has no current reading.
         - If the value is within the acceptable range, the function returns a message indicating normal conditions.
         """
 
-        # Define warning thresholds for different sensors
-        warnings = {
-            "Temperature": {
-                "too_low": (18, "It's too cold to concentrate. Consider turning up the heat."),
-                "too_high": (26, "It's too hot to concentrate. Consider opening a window."),
-            },
-            "Humidity": {
-                "too_low": (30, "The air is too dry. Consider increasing ventilation or opening a window."),
-                "too_high": (60, "The air is too humid. Consider opening a window."),
-            },
-            "CO2": {
-                "too_high": (1000, "CO2 levels are high. Open a window for fresh air."),
-            },
-            "IAQ": {
-                "too_high": (100, "Indoor Air Quality is poor. Consider increasing ventilation or opening a window."),
-            },
-            "UV Index": {
-                "too_high": (6, "UV Index is high. Consider closing the blinds or staying out of direct sunlight."),
-            },
-            "Microphone Noise Level": {
-                "too_high": (80, "Noise levels are high. Consider reducing the noise or moving to a quieter space."),
-            },
-            "Pressure": {
-                "too_low": (980, "Atmospheric pressure is low. It might feel stuffy. Consider opening a window."),
-                "too_high": (1030, "Atmospheric pressure is high. Consider opening a window to ventilate the room."),
-            },
-            "Light": {
-                "too_low": (50, "Light levels are too low. Consider turning on more lights."),
-                "too_high": (1000, "Light levels are too bright. Consider adjusting the lighting."),
-            },
-            "Gas Resistance": {
-                "too_high": (1000, "Gas resistance is high. Open a window or ventilate the room."),
-            },
-            "Occupancy": {
-                "too_high": (10, "Too many people in the room. Consider moving to a less crowded room."),
-            },
-        }
-
-        # Handle case where sensor value is unknown
-        if value == 'unknown':
-            return f"{sensor} has no current value.", True
-
-        # Check if the sensor has predefined thresholds
-        if sensor in warnings:
-            # Check for low-value warnings
-            if "too_low" in warnings[sensor] and float(value) < warnings[sensor]["too_low"][0]:
-                return warnings[sensor]["too_low"][1], False
-
-            # Check for high-value warnings
-            if "too_high" in warnings[sensor] and float(value) > warnings[sensor]["too_high"][0]:
-                return warnings[sensor]["too_high"][1], False
-
-        # If no warnings are triggered, return a message indicating normal conditions
-        return f"{sensor} value is within a comfortable range.", True
+        # The thresholds are evaluated by the cached module-level helper
+        return _get_warning_checker()(sensor, value, unit)
 
     def show_current_data(self, sensor):
         """
@@ -261,57 +867,44 @@ class Dashboard:
             The name of the sensor to display data for (e.g., "Temperature", "Humidity", etc.).
         """
 
-        # Ideal values for various sensors
-        ideal_values = {
-            "Temperature": 21,
-            "Humidity": 45,
-            "CO2": 400,
-            "IAQ": 50,
-            "UV Index": 0,
-            "Microphone Noise Level": 40,
-            "Pressure": 1013,
-            "Light": 400,
-            "Gas Resistance": 200,
-            "Occupancy": 1,
-        }
-
         # Ensure a room is selected in the session state
         if "selected_room" not in st.session_state:
             return  # Exit if no room is selected
 
         room = st.session_state.selected_room
+        room_data = self.data[room]
 
         # Header for the sensor display
-        st.header(f"{self.data[room]['room']} - {sensor}")
+        st.header(f"{room_data['room']} - {sensor}")
 
-        # Get the current value and unit for the sensor
-        sensor_data = self.data[room]["sensors"][sensor]
+        # Get the current value, unit, history and ideal value for the sensor
+        sensor_data = room_data["sensors"][sensor]
         current_value = sensor_data["current_value"]
         unit = sensor_data["unit"]
+        historic_value = sensor_data["history"]
+        ideal = _IDEAL_VALUES[sensor]
 
         # Check if there is any historical data
         last_historic_value = 0
-        if sensor_data["history"]:
-            last_historic_value = float(sensor_data["history"][-1][0])
+        if historic_value:
+            last_historic_value = float(historic_value[-1][0])
 
-        # Prepare historical data for graphing
-        historic_value = sensor_data["history"]
-        timestamps_all = [datetime.fromisoformat(entry[1].replace("Z", "")) for entry in historic_value]
-        values_all = [entry[0] for entry in historic_value]
-
-        # Filter out any future timestamps
-        current_time = datetime.now()
-        timestamps = []
-        values = []
-        for ts, val in zip(timestamps_all, values_all):
-            if ts <= current_time:
-                timestamps.append(ts)
-                values.append(val)
-
-        # Prepare predictions for future data (if applicable)
+        # Prepare historical data for graphing: parse all ISO timestamps in one vectorized pandas call
+        history_df = pd.DataFrame(historic_value, columns=["value", "timestamp"])
+        history_df["timestamp"] = pd.to_datetime(history_df["timestamp"].str.rstrip("Z"), format="ISO8601")
+
+        timestamps_all = history_df["timestamp"].to_numpy(dtype="datetime64[us]")
+        values_all = history_df["value"].to_numpy(dtype=np.float64)
+
+        # Filter out any future timestamps: the history is time-ordered, so a binary search finds the cutoff
+        cutoff = np.searchsorted(timestamps_all, np.datetime64(self._now), side="right")
+        timestamps = timestamps_all[:cutoff]
+        values = values_all[:cutoff]
+
+        # Prepare predictions for future data (if applicable: some panels never show a prognosis)
         predictions = None
         future_times = None
-        if len(timestamps) > 1:
+        if len(timestamps) > 1 and sensor not in _NO_PREDICTION_SENSORS:
             future_times, predictions = self.predict_data(room, sensor, unit, timestamps, values)
 
         # Display occupancy information if the sensor is "Occupancy"
@@ -322,29 +915,27 @@ class Dashboard:
         if current_value is not None and sensor != "Occupancy":
             col1, col2, col3 = st.columns([2, 2, 5])
 
-            # Convert value and calculate delta from last historic value
-            value = float(current_value) if current_value != 'unknown' else 'unknown'
-            delta = round(value - last_historic_value if value != 'unknown' else 0, 2)
+            # Convert the current value once (None if it is unknown) and calculate delta from last historic value
+            value_f = float(current_value) if current_value != 'unknown' else None
+            delta = round(0.0 if value_f is None else value_f - last_historic_value, 2)
 
-            # Determine delta color based on value and delta
-            delta_color = "normal" if value < ideal_values[sensor] and delta < 0 else "inverse" if value > ideal_values[
-                sensor] and delta > 0 else "off"
+            # Determine delta color based on value and delta (no color for unknown values)
+            delta_color = _delta_color(value_f, ideal, delta) if value_f is not None else "off"
 
             # Display current sensor value
-            col1.metric(label=f"current {sensor}", value=f"{value} {unit}", delta=delta, delta_color=delta_color)
+            col1.metric(label=f"current {sensor}", value=f"{value_f if value_f is not None else 'unknown'} {unit}",
+                        delta=delta, delta_color=delta_color)
 
             # Display predicted value in 15 minutes, if applicable
             if predictions:
                 value = round(predictions[0], 2)
-                delta = round(predictions[0] - float(current_value), 2)
-                delta_color = "normal" if value < ideal_values[sensor] \
-                                          and delta < 0 else "inverse" if value > \
-                                        ideal_values[sensor] and delta > 0 else "off"
+                delta = round(0.0 if value_f is None else predictions[0] - value_f, 2)
+                delta_color = _delta_color(value, ideal, delta)
                 col2.metric(label=f"{sensor} in 15 minutes", value=f"{value} {unit}", delta=delta,
                             delta_color=delta_color)
 
             # Check for warnings based on current and predicted values
-            text, result = self.check_for_warnings(sensor, current_value, unit)
+            text, result = self.check_for_warnings(sensor, value_f, unit)
             if result:
                 col3.success(text)
                 if predictions:
@@ -362,7 +953,7 @@ class Dashboard:
 
             # Display historical or combined graph (with predictions)
             if sensor == "Microphone Noise Level" or not (predictions and future_times):
-                self.display_historyic_graph(room, sensor, unit, timestamps, values)
+                self.display_historical_graph(room, sensor, unit, timestamps, values)
             else:
                 self.display_combined_graph(room, sensor, unit, timestamps, values, future_times, predictions)
 
@@ -381,15 +972,14 @@ class Dashboard:
         - unit (str): The unit of the calculated occupancy value (typically people).
         """
 
-        # Creating layout columns for the information to be displayed.
-        col0, = st.columns(1)  # Empty column for structure (not used).
-        col1, col2, col3 = st.columns([10, 10, 1])  # Main columns for displaying information.
+        # Creating layout columns for the information to be displayed
+        # (the narrow third column leaves room for the widened training container).
+        col1, col2, _ = st.columns([10, 10, 1])  # Main columns for displaying information.
 
         with col1:
             # Displaying the current calculated occupancy value.
             st.subheader("Current Calculated Occupancy")
-            c1, c2, c3 = st.columns(3)  # Sub-columns for structured layout.
-            c2.metric(label="Current Occupancy", value=f"{value} {unit}", label_visibility="hidden")
+            st.metric(label="Current Occupancy", value=f"{value} {unit}", label_visibility="hidden")
 
             # Providing a description about the factors that affect the accuracy of occupancy estimation.
             st.subheader("Factors Affecting Accuracy")
@@ -443,9 +1033,9 @@ class Dashboard:
                                              light_level, gas_resistance, room_volume, label)
                     st.toast(f"successfully saved to training data", icon='🎉')
 
-        col3, = st.columns(1)  # Column for displaying the CO2-based occupancy calculation method.
+        col_calc, = st.columns(1)  # Column for displaying the CO2-based occupancy calculation method.
 
-        with col3:
+        with col_calc:
             # Displaying a description of how occupancy is estimated based on CO2 concentration.
             st.subheader("How the Occupancy is Calculated")
             text = """One effective method involves [analyzing the concentration of carbon dioxide (CO₂) in the air](https://pmc.ncbi.nlm.nih.gov/articles/PMC7411428). As humans exhale CO₂, its concentration increases with the number of occupants. By monitoring CO₂ levels, we can estimate occupancy in a non-intrusive manner."""
@@ -468,10 +1058,13 @@ class Dashboard:
             """)
 
     def store_training_data(self, co2, temperature, humidity, iaq, noise_level, pressure, light_level,
-                            gas_resistance, room_volume, label):
+                            gas_resistance, room_volume, label, now=None):
         """
         Stores a new line of training data in a CSV file.
 
+        The row is written before the method returns (see `_TrainingDataFile`), so the
+        confirmation shown afterwards only appears once the row is on disk.
+
         Args:
             co2 (float): CO₂ level in the room.
             temperature (float): Temperature in the room.
@@ -483,28 +1076,16 @@ class Dashboard:
             gas_resistance (float): Gas resistance (VOC levels).
             room_volume (float): Volume of the room (in cubic meters).
             label (int/float): The number of people in the room (or any other target variable).
+            now (datetime, optional): Timestamp of the entry. Defaults to the snapshot taken at the
+                start of the current rerun.
         """
-        # Check if the file exists
-        path = Path(__file__).parent.parent / "training_data" / "training_data.csv"
-        file_exists = os.path.isfile(path)
-
-        # Open the file in append mode
-        with open(path, mode='a', newline='') as file:
-            writer = csv.writer(file)
-
-            # Write the header only if the file is empty (i.e., it doesn't exist)
-            if not file_exists:
-                header = ['CO2', 'Temperature', 'Humidity', 'IAQ', 'Noise_Level', 'Pressure', 'Light_Level',
-                          'Gas_Resistance', 'Room_Volume', 'Datetime', 'Label']
-                writer.writerow(header)
-
-            # Get the current datetime for each entry
-            current_datetime = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # Get the datetime for the entry (the rerun's wall-clock snapshot unless given explicitly)
+        current_datetime = (self._now if now is None else now).strftime('%Y-%m-%d %H:%M:%S')
 
-            # Write the feature values, room volume, datetime, and label as a new row
-            writer.writerow(
-                [co2, temperature, humidity, iaq, noise_level, pressure, light_level, gas_resistance,
-                 room_volume, current_datetime, label])
+        # Write the feature values, room volume, datetime, and label as a new row
+        _get_training_data_file().append(
+            [co2, temperature, humidity, iaq, noise_level, pressure, light_level, gas_resistance,
+             room_volume, current_datetime, label])
 
     def show_sensor_gauge(self, sensor, unit, value):
         """
@@ -516,71 +1097,12 @@ class Dashboard:
         - value (float): The current value measured by the sensor.
         """
 
-        # Defining the optimal range for various sensors.
-        sensor_ranges = {
-            "Temperature": [18, 26],
-            "Humidity": [30, 60],
-            "CO2": [0, 1000],
-            "IAQ": [0, 100],
-            "UV Index": [0, 6],
-            "Microphone Noise Level": [0, 80],
-            "Pressure": [980, 1030],
-            "Light": [50, 1000],
-            "Gas Resistance": [0, 1000],
-            "Occupancy": [0, 10],
-        }
-
-        # Retrieve the good range for the selected sensor.
-        good_range = sensor_ranges[sensor]
-        min_value, max_value = good_range[0] - (good_range[1] - good_range[0]), good_range[1] + (
-                    good_range[1] - good_range[0])
-
-        # Ensure minimum value is not less than 0.
-        if min_value < 0:
-            min_value = 0
-
-        # Round both min and max values to the nearest 10 for better readability.
-        min_value = round(min_value / 10) * 10
-        max_value = round(max_value / 10) * 10
-
-        # Calculate the size of the orange "warning" block (1/4th of the good range).
-        orange_block_size = round((good_range[1] - good_range[0]) / 4)
-
-        # Helper function to normalize the sensor value for the gauge chart.
-        def normalize_value(value):
-            """Normalizes a given sensor value to a 0-1 range for the gauge chart."""
-            nv = (value - min_value) / (max_value - min_value)
-            return round(nv, 2)
-
-        # Configuring the gauge chart options for display.
+        # Configuring the gauge chart options for display: only the current value changes between reruns,
+        # the scale and colors come from the cached template.
         option = {
             "series": [
                 {
-                    "type": "gauge",  # Using gauge chart type.
-                    "startAngle": 180,  # Start angle for the gauge.
-                    "endAngle": 0,  # End angle for the gauge.
-                    "min": min_value,  # Minimum value for the gauge.
-                    "max": max_value,  # Maximum value for the gauge.
-                    "splitNumber": 5,  # Number of divisions in the gauge.
-                    "axisLine": {
-                        "lineStyle": {
-                            "width": 10,  # Width of the gauge line.
-                            "color": [
-                                [normalize_value(good_range[0] - orange_block_size), "#ffb7ac"],  # Red (Too Low)
-                                [normalize_value(good_range[0]), "#f9f8ab"],  # Orange (Warning)
-                                [normalize_value(good_range[1]), "#d4ffce"],  # Green (Optimal)
-                                [normalize_value(good_range[1] + orange_block_size), "#f9f8ab"],  # Orange (Warning)
-                                [normalize_value(max_value), "#ffb7ac"],  # Red (Too High)
-                            ],
-                        }
-                    },
-                    "pointer": {
-                        "length": "60%",  # Pointer length in the gauge.
-                        "itemStyle": {
-                            "color": 'auto'  # Auto color for the pointer.
-                        }
-                    },
-                    "detail": {"formatter": "{value} " + unit},  # Formatting the displayed value with the unit.
+                    **_gauge_series_template(sensor, unit),
                     "data": [{"value": value}],  # Setting the current value to display.
                 }
             ]
@@ -598,8 +1120,8 @@ class Dashboard:
         - room (str): The name or identifier of the room where the sensor is located.
         - sensor (str): The type of sensor being displayed (e.g., "Temperature", "Humidity").
         - unit (str): The unit of measurement for the sensor values (e.g., "°C", "%").
-        - timestamps (list of datetime objects): The historical timestamps for the data points.
-        - values (list of float): The historical sensor values corresponding to the timestamps.
+        - timestamps (numpy.ndarray of datetime64): The historical timestamps for the data points.
+        - values (numpy.ndarray or list of float): The historical sensor values corresponding to the timestamps.
         - future_times (list of datetime objects): The future timestamps for the predicted data points.
         - predictions (list of float): The predicted values corresponding to the future timestamps.
         """
@@ -607,54 +1129,10 @@ class Dashboard:
         # Display the subheader with sensor data type for the current room
         st.subheader(f"{sensor} Data (Historical & Prognosis)")
 
-        # Prepare historical data for the x-axis (formatted as hour:minute)
-        x_axis_historical = [ts.strftime("%H:%M Uhr") for ts in timestamps]
-
-        # Prepare prognosis data for the x-axis (formatted as hour:minute)
-        x_axis_prognosis = [ft.strftime("%H:%M Uhr") for ft in future_times]
-
-        # Combine the historical and prognosis data for the x-axis and pad the historical series to align with prognosis data
-        x_axis_combined = x_axis_historical + x_axis_prognosis  # Combined x-axis data
-        combined_historical_data = values + [None] * len(predictions)  # Historical data with None padding for alignment
-        combined_prognosis_data = [None] * len(values) + predictions  # Prognosis data with None padding for alignment
-
-        # ECharts options for the combined graph
-        combined_options = {
-            "tooltip": {"trigger": "axis"},  # Tooltip on hover, displaying data on the axis
-            "xAxis": {
-                "type": "category",  # X-axis is categorical (time intervals)
-                "data": x_axis_combined,  # X-axis data (combined historical and prognosis)
-                "name": "Time",  # Label for the X-axis
-            },
-            "yAxis": {
-                "type": "value",  # Y-axis represents numerical values
-                "name": sensor,  # Label for the Y-axis (sensor name)
-            },
-            "series": [
-                {
-                    "data": combined_historical_data,  # Historical data points
-                    "type": "line",  # Line graph for historical data
-                    "smooth": True,  # Smooth the line curve
-                    "name": f"Historical: {sensor} ({unit})",  # Label for the historical data series
-                    "lineStyle": {"type": "solid"}  # Solid line style for historical data
-                },
-                {
-                    "data": combined_prognosis_data,  # Prognosis data points
-                    "type": "line",  # Line graph for prognosis data
-                    "smooth": True,  # Smooth the line curve
-                    "name": f"Prognosis: {sensor} ({unit})",  # Label for the prognosis data series
-                    "lineStyle": {"type": "dashed"}  # Dashed line style for prognosis data
-                }
-            ],
-            "legend": {
-                "data": [f"Historical: {sensor} ({unit})", f"Prognosis: {sensor} ({unit})"]
-                # Legend labels for the data series
-            },
-            "dataZoom": [  # Zoom controls for the graph
-                {"type": "slider", "start": 0, "end": 100},  # Slider zoom control for x-axis
-                {"type": "inside"}  # Enables zooming inside the graph
-            ],
-        }
+        # ECharts options for the combined graph (rebuilt only when the series change)
+        combined_options = _combined_graph_options(
+            sensor, unit, np.asarray(timestamps, dtype="datetime64[us]"), np.asarray(values, dtype=np.float64),
+            np.asarray(future_times, dtype="datetime64[us]"), np.asarray(predictions, dtype=np.float64))
 
         # Render the combined graph using Streamlit's ECharts component
         st_echarts(options=combined_options, key=f"{room}_combined_chart")
@@ -667,43 +1145,14 @@ class Dashboard:
         - room (str): The name or identifier of the room where the sensor is located.
         - sensor (str): The type of sensor being displayed (e.g., "Temperature", "Humidity").
         - unit (str): The unit of measurement for the sensor values (e.g., "°C", "%").
-        - timestamps (list of datetime objects): The historical timestamps for the data points.
-        - values (list of float): The historical sensor values corresponding to the timestamps.
+        - timestamps (numpy.ndarray of datetime64 or list of datetime objects): The historical timestamps
+          for the data points.
+        - values (numpy.ndarray or list of float): The historical sensor values corresponding to the timestamps.
         """
 
-        # Prepare historical data for the x-axis (formatted as hour:minute)
-        x_axis_historical = [ts.strftime("%H:%M Uhr") for ts in timestamps]
-
-        # Historical data series configuration for the line chart
-        historical_series = {
-            "data": values,  # The actual historical values to be plotted
-            "type": "line",  # Line chart type
-            "smooth": True,  # Smooth the curve of the line
-            "name": f"{sensor} ({unit})"  # Label for the line
-        }
-
-        # ECharts options for displaying the historical data
-        historical_options = {
-            "title": {"text": f"Historical Data"},  # Title of the chart
-            "tooltip": {"trigger": "axis"},  # Tooltip on hover over data points
-            "xAxis": {
-                "type": "category",  # X-axis is categorical (time intervals)
-                "data": x_axis_historical,  # Data for the x-axis (time)
-                "name": "Time"  # Label for the X-axis
-            },
-            "yAxis": {
-                "type": "value",  # Y-axis represents numerical values
-                "name": sensor  # Label for the Y-axis (sensor name)
-            },
-            "series": historical_series,  # Data series (historical values)
-            "legend": {
-                "data": [historical_series["name"]]  # Legend label for the historical data series
-            },
-            "dataZoom": [  # Zoom controls for the graph
-                {"type": "slider", "start": 0, "end": 100},  # Slider zoom control for x-axis
-                {"type": "inside"}  # Enables zooming inside the graph
-            ],
-        }
+        # ECharts options for displaying the historical data (rebuilt only when the series change)
+        historical_options = _historical_graph_options(
+            sensor, unit, np.asarray(timestamps, dtype="datetime64[us]"), np.asarray(values, dtype=np.float64))
 
         # Render the historical graph using Streamlit's ECharts component
         st_echarts(options=historical_options, key=f"{room}_historical_chart")
@@ -716,70 +1165,21 @@ class Dashboard:
         - room (str): The name or identifier of the room where the sensor is located.
         - sensor (str): The type of sensor being predicted (e.g., "Temperature", "Humidity").
         - unit (str): The unit of measurement for the sensor values (e.g., "°C", "%").
-        - timestamps (list of datetime objects): The timestamps corresponding to the sensor values.
-        - values (list of float): The historical sensor values corresponding to the timestamps.
+        - timestamps (numpy.ndarray of datetime64): The timestamps corresponding to the sensor values.
+        - values (numpy.ndarray of float): The historical sensor values corresponding to the timestamps.
 
         Returns:
         - future_times (list of datetime objects): The predicted future times in 15-minute intervals.
         - predictions (list of float): The predicted sensor values for the future times.
         """
 
-        # Case 1: Use only the last two hours of data
-        two_hours_ago = timestamps[-1] - timedelta(hours=2)
-        recent_indices = [i for i, ts in enumerate(timestamps) if ts >= two_hours_ago]
-
-        # Special case for Light sensor, where all historical data is used
-        if sensor == "Light":
-            recent_indices = [i for i, ts in enumerate(timestamps)]
+        # Round the current time (snapshot taken at the start of the rerun) down to the nearest 15-minute interval
+        current_time = self._now
+        nearest_quarter_hour = current_time.replace(minute=current_time.minute // 15 * 15, second=0, microsecond=0)
 
-        # Extract the recent timestamps and values
-        recent_timestamps = [timestamps[i] for i in recent_indices]
-        recent_values = [values[i] for i in recent_indices]
-
-        # Case 2: Use data from the last significant turning point (local maxima or minima)
-        turning_point_index = None
-        if sensor not in ["Microphone Noise Level", "Occupancy", "Light"]:  # Ignore for certain sensors
-            for i in range(len(values) - 2, 0, -1):  # Search for turning point from the end
-                if (values[i] > values[i - 1] and values[i] > values[i + 1]) or (
-                        values[i] < values[i - 1] and values[i] < values[i + 1]):
-                    turning_point_index = i
-                    break
-
-        # If a turning point is found, adjust the data to start from that point
-        if turning_point_index:
-            recent_timestamps = timestamps[turning_point_index:]
-            recent_values = values[turning_point_index:]
-
-        # Prepare data for regression (time in seconds from the first timestamp)
-        time_numbers = np.array([(ts - recent_timestamps[0]).total_seconds() for ts in recent_timestamps])
-
-        # Perform linear regression using scipy.stats.linregress
-        slope, intercept, r_value, p_value, std_err = stats.linregress(time_numbers, recent_values)
-
-        # Define the prediction function based on the linear regression model
-        def myfunc(x):
-            return slope * x + intercept
-
-        # Round the current time down to the nearest 15-minute interval
-        current_time = datetime.now()
-        minute_adjustment = current_time.minute % 15
-        nearest_quarter_hour = current_time - timedelta(minutes=minute_adjustment, seconds=current_time.second,
-                                                        microseconds=current_time.microsecond)
-
-        # Generate future times in 15-minute intervals (next 6 hours)
-        future_times = [nearest_quarter_hour + timedelta(minutes=15 * i) for i in range(0, 25)]  # 6 hours ahead
-
-        # Prepare future time data for prediction (convert to seconds since the first timestamp)
-        future_time_numbers = np.array([(ft - recent_timestamps[0]).total_seconds() for ft in future_times])
-
-        # Use the regression model to predict future values
-        predictions = list(map(myfunc, future_time_numbers))
-
-        # Set negative predictions to 0, if applicable (e.g., if sensor values can't be negative)
-        predictions = [max(0, p) for p in predictions]
-
-        # Return the predicted future times and values
-        return future_times, predictions
+        # The regression itself is shared through the cache; room and unit do not influence the result
+        return _predict_data(sensor, np.asarray(timestamps, dtype="datetime64[us]"),
+                             np.asarray(values, dtype=np.float64), nearest_quarter_hour)
 
 
     def display_future_graph(self, future_times, predictions, sensor, unit):
@@ -792,31 +1192,9 @@ class Dashboard:
         sensor (str): The type of sensor (e.g., Temperature, CO2, etc.).
         unit (str): The unit of measurement for the sensor (e.g., °C, ppm, etc.).
         """
-        # Prepare the x-axis labels (times in HH:MM format)
-        x_axis_prognosis = [ft.strftime("%H:%M Uhr") for ft in future_times]
-
-        # Prepare the series data for the prognosis line
-        prognosis_series = {
-            "data": predictions,
-            "type": "line",
-            "smooth": True,
-            "name": f"Prognosis: {sensor} ({unit})",
-            "lineStyle": {"type": "dashed"}
-        }
-
-        # ECharts options for rendering the prognosis graph
-        prognosis_options = {
-            "title": {"text": f"Prognosis"},
-            "tooltip": {"trigger": "axis"},
-            "xAxis": {"type": "category", "data": x_axis_prognosis, "name": "Time"},
-            "yAxis": {"type": "value", "name": sensor},
-            "series": prognosis_series,
-            "legend": {"data": prognosis_series["name"]},
-            "dataZoom": [
-                {"type": "slider", "start": 0, "end": 100},
-                {"type": "inside"}
-            ],
-        }
+        # ECharts options for rendering the prognosis graph (rebuilt only when the prediction changes)
+        prognosis_options = _future_graph_options(
+            sensor, unit, np.asarray(future_times, dtype="datetime64[us]"), np.asarray(predictions, dtype=np.float64))
 
         # Render the ECharts graph using Streamlit
         st_echarts(options=prognosis_options, key=f"prognosis_chart")
@@ -832,111 +1210,22 @@ class Dashboard:
         sensor_detail (bool): Whether to display how the sensor is measured.
         text (str): Additional text information to display.
         """
-        # Descriptions of sensor concentration impact
-        sensor_descriptions_concentration = {
-            "Temperature": """
-                Temperature plays a crucial role in human concentration and cognitive performance. Studies show that higher temperatures can lead to increased fatigue, dehydration, and reduced mental clarity, while colder environments often result in physical discomfort, increased energy expenditure, and diminished focus. Maintaining an optimal room temperature of around 20-22°C is critical for ensuring comfort, mental sharpness, and productivity.
-                """,
-
-            "Humidity": """
-                High humidity can increase discomfort by impairing the body’s ability to cool itself, while low humidity can dry out 
-                mucous membranes, causing irritation. Maintaining an indoor humidity level between 40–60% supports comfort, 
-                respiratory health, and focus.
-                """,
-
-            "CO2": """
-                Elevated CO2 levels (above 1000 ppm) can impair cognitive function, causing fatigue, headaches, and reduced alertness. 
-                Maintaining CO2 levels below 800 ppm is optimal for productivity and well-being.
-                """,
-
-            "IAQ": """
-                Poor air quality can lead to respiratory irritation, headaches, and reduced cognitive performance. 
-                Monitoring IAQ helps ensure a healthier, more productive environment by managing indoor pollutants.
-                """,
-
-            "UV Index": """
-                Prolonged exposure to high UV levels can cause skin damage, eye strain, and increase the risk of skin cancer. 
-                Monitoring UV levels helps reduce harmful exposure, ensuring health and focus.
-                """,
-
-            "Microphone Noise Level": """
-                High noise levels can disrupt concentration, increase stress, and impair communication. 
-                Prolonged exposure to noise above 70 dB may lead to fatigue and decreased productivity.
-                """,
-
-            "Pressure": """
-                Pressure fluctuations can cause discomfort, headaches, and fatigue, especially for those sensitive to weather changes. 
-                Stable pressure is ideal for comfort and focus.
-                """,
-
-            "Light": """
-                Inadequate lighting can cause eye strain and fatigue, reducing concentration. 
-                Proper lighting, with a temperature between 4000–5000 K, enhances alertness and focus.
-                """,
-
-            "Gas Resistance": """
-                Exposure to harmful gases can cause respiratory issues, headaches, and long-term health risks. 
-                Monitoring gas concentrations ensures safety and maintains good air quality.
-                """,
-        }
-
-        # Descriptions of how sensors measure the data
-        sensor_descriptions_detail = {
-            "Temperature": """
-                The BME680 and SCD30 sensors work together to provide an accurate, combined temperature reading. The BME680 uses an integrated thermistor to measure ambient temperature by detecting resistance changes as heat energy fluctuates. The SCD30 adds further precision by incorporating a Kalman-filtered combination of both sensors’ data, ensuring stable and reliable temperature readings. This fusion of data ensures highly accurate temperature monitoring, contributing to a more comfortable and productive environment.
-                """,
-            "Humidity": """
-                The BME680 and SCD30 sensors work together to measure relative humidity accurately. The BME680 uses a capacitive humidity sensor that detects changes in capacitance as the polymer film absorbs water molecules, while the SCD30 sensor uses a similar capacitive approach to detect humidity levels. These sensors’ data are combined through a Kalman filter, providing a reliable and stable humidity measurement that helps create an optimal environment for focus and comfort.
-                """,
-
-            "CO2": """
-                The SCD30 sensor uses nondispersive infrared (NDIR) technology to measure CO2 concentration. It emits infrared light and measures the absorption by CO2 molecules to provide an accurate reading.
-                """,
-
-            "IAQ": """
-                The BME680 sensor assesses indoor air quality by detecting volatile organic compounds (VOCs) and other gaseous pollutants. It uses a metal-oxide semiconductor that reacts with gases, changing its conductivity to generate an air quality index.
-                """,
-
-            "UV Index": """
-                The LTR390 sensor measures ultraviolet (UV) radiation intensity with photodiodes sensitive to UV wavelengths. It provides accurate data on UV levels, enabling UV index calculation.
-                """,
-
-            "Microphone Noise Level": """
-                The MAX4466 sensor detects sound levels by measuring pressure changes in sound waves, converting them into an electrical signal. 
-                """,
-
-            "Pressure": """
-                The BME680 sensor measures atmospheric pressure using a piezoresistive sensor, which detects pressure changes 
-                based on diaphragm deformation and converts this into an electrical signal.
-                """,
-
-            "Light": """
-                The LTR390 sensor measures light intensity using photodiodes, and the APDS-9960 sensor detects light temperature, 
-                proximity, and color to monitor ambient lighting conditions.
-                """,
-
-            "Gas Resistance": """
-                The MICS-6814 sensor detects gases like ammonia (NH3), carbon monoxide (CO), and nitrogen dioxide (NO2) 
-                using metal-oxide semiconductors that change resistance in response to gas molecules.
-                """,
-        }
-
-        # Function to stream the description text with a slight delay
+        # Function to stream the description text with a slight delay (the words are split only once per text)
         def stream_data(text):
-            for word in text.split(" "):
-                yield word + " "
-                time.sleep(0.02)
+            for word in _stream_words(text):
+                yield word
+                time.sleep(_STREAM_WORD_DELAY)
 
         # Display concentration-related text if the flag is set
         if concentration:
-            text_1 = sensor_descriptions_concentration[sensor]
+            text_1 = _SENSOR_DESC_CONCENTRATION[sensor]
             st.subheader("Why is it Important?")
             st.write_stream(stream_data(text_1))
 
         # Display sensor measurement details if the flag is set
         if sensor_detail:
             st.subheader("How it is Measured")
-            text_2 = sensor_descriptions_detail[sensor]
+            text_2 = _SENSOR_DESC_DETAIL[sensor]
             st.write_stream(stream_data(text_2))
 
         # Display additional text if provided
@@ -951,6 +1240,10 @@ class Dashboard:
         and dynamically displays sensor data for the selected room when a user interacts with the dashboard.
         It updates the content based on the selected sensor and room.
         """
+        # Take a single wall-clock snapshot for the whole rerun so every panel filters,
+        # predicts and timestamps against the same moment
+        self._now = datetime.now()
+
         self.set_page_style()  # Set custom page style and background
         st.title("Multisensor Visualization")  # Set the page title
 
@@ -985,49 +1278,17 @@ class Dashboard:
         and hides the default Streamlit menu. It also loads a logo and applies custom CSS for the page container
         and background image.
         """
-        # Define the path for the logo image
-        png_file = Path(__file__).parent / "media" / "zeki_logo.png"
-        # Convert the Path object to string to ensure compatibility
-        png_file_str = str(png_file)
         # Set the logo (works if deployed on Streamlit Cloud)
-        st.logo(png_file_str, icon_image=png_file_str)
+        st.logo(_LOGO_PATH, icon_image=_LOGO_PATH)
 
         # Set the Streamlit page configuration (title and icon)
-        #st.set_page_config(page_title="MSV", page_icon=png_file_str)
+        #st.set_page_config(page_title="MSV", page_icon=_LOGO_PATH)
 
-        # Define the path for the 3D room plan image
-        png_file = Path(__file__).parent / "media" / "ZEKI-Floorplan-1536x640.png"
+        # Custom CSS for background image, layout and the hidden menu (built only once)
+        page_style = _page_style_css()
 
-        # Read and encode the image as base64 to be used in the background
-        with open(png_file, "rb") as f:
-            data = f.read()
-        bin_str = base64.b64encode(data).decode()
-
-        # Define custom CSS for background image and layout
-        page_bg_img = f"""
-        <style>
-        /* Set the background image for the entire Streamlit app container */
-        .stMainBlockContainer {{
-            max-width: 95%; /* Limit content width to 95% of the screen */
-            background-image: url("data:image/png;base64,{bin_str}");
-            background-size: 105% 500px;  /* Ensure the image covers the container */
-            background-repeat: no-repeat;  /* Prevent the image from repeating */
-            background-position: center calc(190px);  /* Position the background image */
-        }};
-        .stMainMenu {{visibility: hidden}}  /* Hide the default menu */
-        </style>
-        """
-        # Apply the background image and CSS to the app
-        st.markdown(page_bg_img, unsafe_allow_html=True)
-
-        # Hide the main menu using custom CSS
-        hide_menu_style = """
-        <style>
-        #MainMenu {visibility: hidden;}
-        </style>
-        """
-        # Apply the hide menu CSS
-        st.markdown(hide_menu_style, unsafe_allow_html=True)
+        # Apply the background image and CSS to the app in a single markdown element
+        st.markdown(page_style, unsafe_allow_html=True)
 
     def show_warnings(self):
         """
@@ -1053,8 +1314,20 @@ class Dashboard:
                 if not result:
                     st.toast(f"{room}: " + text, icon="🚨")  # Display warning with an alert icon
 
+@st.cache_resource
+def _get_sensor_data():
+    """
+    Returns the sensor backend shared by all reruns and sessions.
+
+    `Sensor_Data` queries Home Assistant and InfluxDB on creation and starts its own thread that
+    refreshes `data` in place every 60 seconds, so it is created once per process. No TTL is set:
+    expiring the instance would leave its update thread running and start another one.
+    """
+    return sensor_data.Sensor_Data()
+
+
 # Run the dashboard
 if __name__ == "__main__":
-    # Initialize the sensors_data structure
-    data = sensor_data.Sensor_Data().data
+    # Get the (shared, periodically updated) sensors_data structure
+    data = _get_sensor_data().data
     Dashboard(data)
@@ -1,19 +1,196 @@
 import streamlit as st
-import datetime
-import matplotlib.pyplot as plt
-from PIL import Image, ImageDraw, ImageFont
+from collections import defaultdict
+import html
+import io
+import altair as alt
+from PIL import Image
 from pathlib import Path
-import time
+from streamlit_autorefresh import st_autorefresh
+from streamlit.elements.lib.image_utils import image_to_url
 from src import sensor_data as sd
-from sklearn.linear_model import LinearRegression
 import numpy as np
-from datetime import datetime, timedelta
+import pandas as pd
+from math import fsum
+
+
+@st.cache_resource
+def get_base_image(image_path):
+    """Open the room plan once and add a white background for transparency."""
+    image = Image.open(image_path).convert("RGBA")
+    white_bg = Image.new("RGBA", image.size, "WHITE")  # Create white background
+    return Image.alpha_composite(white_bg, image).convert("RGB")
+
+
+@st.cache_resource
+def get_base_image_png(image_path):
+    """
+    Encode the room plan once as PNG bytes, together with its size.
+    """
+    image = get_base_image(image_path)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue(), image.size
+
+
+def get_room_plan_url(image_path):
+    """
+    Register the room plan as a media file of the current run and return its URL.
+
+    The URL is derived from the image bytes, so it stays the same across reruns and the browser
+    loads (and caches) the image once instead of receiving it with every rerun.
+    """
+    return image_to_url(get_base_image_png(image_path)[0], -1, False, "RGB", "PNG", "room_plan")
+
+# Label font size and padding (in pixels of the full-size room plan, scaled with the displayed image)
+LABEL_FONT_SIZE = 25
+LABEL_PADDING = 10
+
+
+@st.cache_data
+def get_sensor_names(sensor_ids, _data):
+    """List all available sensors once per sensor schema (`_data` is not hashed)."""
+    sensors = []
+    for sensor_id in sensor_ids:
+        for sensor in _data[sensor_id].keys():
+            if sensor not in sensors:
+                sensors.append(sensor)
+    return sensors
+
+
+@st.cache_data
+def get_room_set(sensor_ids, _data):
+    """Collect the distinct rooms once per sensor schema (`_data` is not hashed)."""
+    return list(dict.fromkeys(_data[sensor_id]["room"] for sensor_id in sensor_ids))
+
+
+@st.cache_resource
+def get_sensor_data():
+    """Create the Sensor_Data instance (and its update thread) once for all reruns and sessions."""
+    return sd.Sensor_Data()
+
+
+@st.cache_data(max_entries=32)
+def get_room_overlay(version, selected_sensor, _render):
+    """
+    Cache the room plan overlay per data version and selected sensor.
+
+    `_render` builds the overlay HTML (it is not hashed), so it only runs again once Sensor_Data
+    ingested new points or another sensor was selected.
+    """
+    return _render(selected_sensor)
+
+
+@st.cache_data(max_entries=64)
+def get_room_graph_frame(version, sensor, sensor_ids, _data):
+    """
+    Collect the historical and prognosis data of a room as one long-format DataFrame.
+
+    The frame is built from the given sensor (or all sensors if None) of the multisensors in sensor_ids
+    and cached per data version, so the histories are neither copied nor hashed until Sensor_Data
+    ingested new points (`_data` is not hashed). Each row is a (timestamp, sensor, value, kind) record
+    with kind either "actual" or "prognosis".
+    """
+    # Collect the sensors to plot as (sensor_name, unit, history) triples
+    plot_items = []
+    for sensor_id in sensor_ids:
+        sensors = _data[sensor_id]["sensors"]
+        sensors_to_plot = {sensor: sensors[sensor]} if sensor else sensors
+        for sensor_name, details in sensors_to_plot.items():
+            plot_items.append((sensor_name, details["unit"], details["history"]))
+
+    frames = []
+    for sensor_name, unit, history in plot_items:
+        # History as an (N, 2) array of [value, timestamp] pairs
+        history = np.asarray(history, dtype=object).reshape(-1, 2)
+        label = f"{sensor_name} ({unit})"
+
+        # Extract timestamps (parsed in one vectorized call, naive like the "Z"-stripped originals)
+        # and values
+        timestamps = pd.to_datetime(history[:, 1], format="ISO8601", utc=True).tz_localize(None).to_numpy()
+        values = history[:, 0].astype(np.float64)
+
+        # Actual data
+        frames.append(pd.DataFrame({"timestamp": timestamps, "sensor": label, "value": values, "kind": "actual"}))
+
+        # Prepare data for linear regression
+        if len(timestamps) > 1:
+            time_numbers = (timestamps - timestamps[0]) / np.timedelta64(1, "s")
+
+            # Perform linear regression (closed-form least-squares line)
+            slope, intercept = np.polyfit(time_numbers, values, 1)
+
+            # Generate predictions for the rest of the day
+            future_times = (
+                timestamps[-1] + np.arange(1, 17) * np.timedelta64(15, "m")
+            )  # Predict for the next 4 hours (15 min intervals)
+            future_time_numbers = (future_times - timestamps[0]) / np.timedelta64(1, "s")
+            predictions = slope * future_time_numbers + intercept
+
+            # Prognosis
+            frames.append(
+                pd.DataFrame({"timestamp": future_times, "sensor": label, "value": predictions, "kind": "prognosis"})
+            )
+
+    if not frames:
+        return pd.DataFrame(columns=["timestamp", "sensor", "value", "kind"])
+    return pd.concat(frames, ignore_index=True)
+
+# Constants for the Sensor Fusion
+FUSION_ROOM_VOLUME = 50  # m³
+FUSION_BASELINE_CO2 = 400  # ppm
+FUSION_CO2_PRODUCTION_RATE = 18  # L/h/person
+FUSION_TIME_ELAPSED = 1  # hour
+
+FUSION_BASELINE_NOISE = 40  # dB (empty room)
+FUSION_NOISE_SCALING_FACTOR = 1.5
+
+FUSION_BASELINE_TEMP = 22  # °C
+FUSION_BASELINE_HUMIDITY = 40  # %
+FUSION_TEMP_FACTOR = 0.5
+FUSION_HUMIDITY_FACTOR = 1.0
+
+FUSION_WEIGHTS = (0.4, 0.3, 0.3)  # CO2, Noise, Temp+Humidity
+FUSION_CATEGORIES = ("co2", "noise", "temperature", "humidity")
+
+
+def fuse_all(co2, noise, temperature, humidity):
+    """
+    Estimate the number of people in all rooms at once using Sensor Fusion.
+
+    Vectorized counterpart of Dashboard.calculate_sensor_fusion: each argument is a
+    (rooms, max_sensors) float array with one row per room, padded with NaN where a room
+    has fewer sensors of that kind. Returns one non-negative estimate per room.
+    """
+    def row_means(values):
+        # Mean of the non-NaN entries of each row and whether the row has any
+        counts = np.count_nonzero(~np.isnan(values), axis=1)
+        sums = np.nansum(values, axis=1)
+        return np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0), counts > 0
+
+    avg_co2, has_co2 = row_means(co2)
+    avg_noise, has_noise = row_means(noise)
+    avg_temp, has_temp = row_means(temperature)
+    avg_humidity, has_humidity = row_means(humidity)
+
+    # CO2-, noise- and Temp & Humidity-based estimates, 0 where a room has no values
+    co2_people = np.where(has_co2, (avg_co2 - FUSION_BASELINE_CO2) * FUSION_ROOM_VOLUME
+                          / (FUSION_CO2_PRODUCTION_RATE * FUSION_TIME_ELAPSED), 0.0)
+    noise_people = np.where(has_noise, FUSION_NOISE_SCALING_FACTOR * (avg_noise / FUSION_BASELINE_NOISE), 0.0)
+    temp_humidity_people = np.where(has_temp & has_humidity,
+                                    (avg_temp - FUSION_BASELINE_TEMP) * FUSION_TEMP_FACTOR
+                                    + (avg_humidity - FUSION_BASELINE_HUMIDITY) * FUSION_HUMIDITY_FACTOR, 0.0)
+
+    # Sensor Fusion (weighted average), ensuring non-negative counts
+    final_people_count = (FUSION_WEIGHTS[0] * co2_people +
+                          FUSION_WEIGHTS[1] * noise_people +
+                          FUSION_WEIGHTS[2] * temp_humidity_people)
+    return np.maximum(0, final_people_count)
 
 
 class Dashboard:
     def __init__(self):
-        # Create sensor_data instance that holds a dictionary with all sensors for each room
-        self.sensor_data = sd.Sensor_Data()
+        # Shared sensor_data instance that holds a dictionary with all sensors for each room
+        self.sensor_data = get_sensor_data()
         self.data = self.sensor_data.data  # dictionary with all sensors for each room, current and historic data for each sensor
 
         # Initialize rooms and sensors
@@ -24,11 +201,15 @@ class Dashboard:
             "Co-Working-Space", "Social Lounge"
         ]
 
-        self.sensors = []  # list of all available sensors extracted from self.data
-        for room, sensors in self.data.items():
-            for sensor in sensors.keys():
-                if sensor not in self.sensors:
-                    self.sensors.append(sensor)
+        # The sensor schema is static, so the enumerations are cached on the tuple of sensor ids
+        sensor_ids = tuple(self.data.keys())
+        self.sensors = get_sensor_names(sensor_ids, self.data)  # list of all available sensors extracted from self.data
+        self.room_names = get_room_set(sensor_ids, self.data)  # rooms with a multisensor, in data order
+
+        # Reverse index of the multisensors in each room, built in one pass over self.data
+        self.rooms_to_sensor_ids = defaultdict(list)
+        for sensor_id, sensor_data in self.data.items():
+            self.rooms_to_sensor_ids[sensor_data["room"]].append(sensor_id)
 
         self.room_plan_image_path = Path("media/ZEKI-Floorplan-1536x640.png")  # image of the 3d room plan
 
@@ -48,27 +229,44 @@ class Dashboard:
             "multisensor_113": (100, 350)
         }
 
+        # Sensor keys of each room per fusion category, matched once by substring (the schema is static)
+        self.room_category_keys = {}
+        for sensor_id in self.room_coordinates:
+            sensors = self.data.get(sensor_id, {}).get("sensors", {})
+            self.room_category_keys[sensor_id] = {
+                category: [s for s in sensors if category in s]
+                for category in FUSION_CATEGORIES
+            }
+
+        # Preallocated fusion inputs (rooms x max sensors per category), refilled on every frame
+        self.fusion_inputs = {
+            category: np.full((len(self.room_coordinates),
+                               max((len(keys[category]) for keys in self.room_category_keys.values()), default=0)),
+                              np.nan)
+            for category in FUSION_CATEGORIES
+        }
+
         self.run()
 
     def calculate_sensor_fusion(self, sensor_data):
         """
         Calculate the estimated number of people in the room using Sensor Fusion.
         """
-        # Constants for fusion calculation
-        room_volume = 50  # m³
-        baseline_co2 = 400  # ppm
-        co2_production_rate = 18  # L/h/person
-        time_elapsed = 1  # hour
+        # Constants for fusion calculation (shared with fuse_all)
+        room_volume = FUSION_ROOM_VOLUME
+        baseline_co2 = FUSION_BASELINE_CO2
+        co2_production_rate = FUSION_CO2_PRODUCTION_RATE
+        time_elapsed = FUSION_TIME_ELAPSED
 
-        baseline_noise = 40  # dB (empty room)
-        noise_scaling_factor = 1.5
+        baseline_noise = FUSION_BASELINE_NOISE
+        noise_scaling_factor = FUSION_NOISE_SCALING_FACTOR
 
-        baseline_temp = 22  # °C
-        baseline_humidity = 40  # %
-        temp_factor = 0.5
-        humidity_factor = 1.0
+        baseline_temp = FUSION_BASELINE_TEMP
+        baseline_humidity = FUSION_BASELINE_HUMIDITY
+        temp_factor = FUSION_TEMP_FACTOR
+        humidity_factor = FUSION_HUMIDITY_FACTOR
 
-        # Sensor values
+        # Sensor values (only a few per room, so the means are taken in plain Python instead of np.mean)
         co2_values = sensor_data.get("co2", [])
         noise_levels = sensor_data.get("noise", [])
         temperatures = sensor_data.get("temperature", [])
@@ -76,7 +274,7 @@ class Dashboard:
 
         # Calculate CO2-based estimate
         if co2_values:
-            avg_co2 = np.mean(co2_values)
+            avg_co2 = fsum(co2_values) / len(co2_values)
             co2_diff = avg_co2 - baseline_co2
             co2_people = (co2_diff * room_volume) / (co2_production_rate * time_elapsed)
         else:
@@ -84,15 +282,15 @@ class Dashboard:
 
         # Calculate Noise-based estimate
         if noise_levels:
-            avg_noise = np.mean(noise_levels)
+            avg_noise = fsum(noise_levels) / len(noise_levels)
             noise_people = noise_scaling_factor * (avg_noise / baseline_noise)
         else:
             noise_people = 0
 
         # Calculate Temp & Humidity-based estimate
         if temperatures and humidities:
-            avg_temp = np.mean(temperatures)
-            avg_humidity = np.mean(humidities)
+            avg_temp = fsum(temperatures) / len(temperatures)
+            avg_humidity = fsum(humidities) / len(humidities)
             temp_diff = avg_temp - baseline_temp
             humidity_diff = avg_humidity - baseline_humidity
             temp_humidity_people = (temp_diff * temp_factor) + (humidity_diff * humidity_factor)
@@ -100,7 +298,7 @@ class Dashboard:
             temp_humidity_people = 0
 
         # Sensor Fusion (weighted average)
-        weights = [0.4, 0.3, 0.3]  # CO2, Noise, Temp+Humidity
+        weights = FUSION_WEIGHTS  # CO2, Noise, Temp+Humidity
         final_people_count = (weights[0] * co2_people +
                               weights[1] * noise_people +
                               weights[2] * temp_humidity_people)
@@ -108,144 +306,90 @@ class Dashboard:
         return max(0, final_people_count)  # Ensure non-negative count
 
     def show_current_data(self, selected_sensor):
-        """Overlay sensor values on the room plan image."""
+        """Overlay sensor values on the room plan image, reused until Sensor_Data ingests new points."""
+        return get_room_overlay(self.sensor_data.version, selected_sensor, self.render_room_overlay)
+
+    def render_room_overlay(self, selected_sensor):
+        """
+        Build the HTML labels with the sensor values, placed over the room plan image they are rendered with.
+
+        Positions, font size and padding are given in container query units (cqw, hundredths of the
+        displayed width), so the labels scale with the image to any column width.
+        """
         if self.room_plan_image_path.exists():
-            # Open the room plan and add a white background for transparency
-            image = Image.open(self.room_plan_image_path).convert("RGBA")
-            white_bg = Image.new("RGBA", image.size, "WHITE")  # Create white background
-            image = Image.alpha_composite(white_bg, image).convert("RGB")
-
-            # Draw on image with the font
-            draw = ImageDraw.Draw(image)
-            try:
-                # Load a custom font, if available, or default to system font
-                font = ImageFont.truetype("Arial.ttf", 25)  # Adjust font size if needed
-            except IOError:
-                font = ImageFont.load_default()
-
-            # Draw each room's sensor value and estimated people count at its coordinates
-            for sensor_id, coords in self.room_coordinates.items():
+            # Only the size of the room plan is needed here, the image itself is referenced by its URL
+            width = get_base_image_png(self.room_plan_image_path)[1][0]
+            scale = 100 / width  # Pixels of the full-size room plan -> cqw
+
+            # Collect sensor data for fusion of all rooms (using the precomputed keys of each category)
+            for values in self.fusion_inputs.values():
+                values.fill(np.nan)
+            for row, sensor_id in enumerate(self.room_coordinates):
                 sensors = self.data.get(sensor_id, {}).get("sensors", {})
+                for category, keys in self.room_category_keys[sensor_id].items():
+                    self.fusion_inputs[category][row, :len(keys)] = [sensors[s]["current_value"] for s in keys]
 
-                # Collect sensor data for fusion
-                sensor_data = {
-                    "co2": [sensors[s]["current_value"] for s in sensors if "co2" in s],
-                    "noise": [sensors[s]["current_value"] for s in sensors if "noise" in s],
-                    "temperature": [sensors[s]["current_value"] for s in sensors if "temperature" in s],
-                    "humidity": [sensors[s]["current_value"] for s in sensors if "humidity" in s],
-                }
+            # Estimate people count of every room using Sensor Fusion in a single call
+            people_counts = fuse_all(*(self.fusion_inputs[category] for category in FUSION_CATEGORIES))
 
-                # Estimate people count using Sensor Fusion
-                people_count = self.calculate_sensor_fusion(sensor_data)
+            # Place each room's sensor value and estimated people count at its coordinates
+            labels = []
+            for (sensor_id, coords), people_count in zip(self.room_coordinates.items(), people_counts):
+                sensors = self.data.get(sensor_id, {}).get("sensors", {})
 
                 # Format the text if the values exist
                 sensor_value = sensors[selected_sensor]["current_value"] if selected_sensor in sensors else None
                 sensor_unit = sensors[selected_sensor]["unit"] if selected_sensor in sensors else None
 
                 if sensor_value and sensor_unit:
-                    text = f"{sensor_value:.1f} {sensor_unit}\nPeople: {people_count:.1f}"
+                    text = f"{sensor_value:.1f} {html.escape(sensor_unit)}<br>People: {people_count:.1f}"
                 else:
                     text = f"People: {people_count:.1f}"  # If either value doesn't exist, show only people count
 
-                # Get bounding box of the text
-                text_bbox = draw.textbbox((coords[0], coords[1]), text, font=font)
-
-                # Calculate padding for the rectangle
-                padding = 10
-                rect_bbox = [
-                    text_bbox[0] - padding,  # Left
-                    text_bbox[1] - padding,  # Top
-                    text_bbox[2] + padding,  # Right
-                    text_bbox[3] + padding  # Bottom
-                ]
-
-                # Draw a white rectangle behind the text
-                draw.rectangle(rect_bbox, fill="white")
-
-                # Draw the text in black
-                draw.text((coords[0], coords[1]), text, font=font, fill="black")
-            return image
+                # Black text on a white box with padding around it, at the room's coordinates of the
+                # full-size image, all scaled to the displayed width
+                labels.append(
+                    f'<div style="position: absolute; left: {(coords[0] - LABEL_PADDING) * scale:.3f}cqw; '
+                    f'top: {(coords[1] - LABEL_PADDING) * scale:.3f}cqw; padding: {LABEL_PADDING * scale:.3f}cqw; '
+                    f'font-size: {LABEL_FONT_SIZE * scale:.3f}cqw; background: white; color: black; '
+                    f'line-height: 1.2; white-space: nowrap;">{text}</div>'
+                )
+            return "".join(labels)
         else:
             st.warning("Room plan image not found!")
             return None
 
     def display_room_graph(self, room, sensor=None):
         """Display time-series data graph and prognosis for a specific room and sensor."""
-        if room not in [sensor_data["room"] for sensor_data in self.data.values()]:
+        if room not in self.room_names:
             st.error(f"Room '{room}' not found in the data.")
             return
 
-        # Initialize the plots
-        fig, axes = plt.subplots(2, 1, figsize=(10, 12), sharex=True)
-        fig.suptitle(f"Sensor Data for {room}")
-
-        for sensor_id, sensor_data in self.data.items():
-            if sensor_data["room"] == room:
-                sensors = sensor_data["sensors"]
-
-                # If a specific sensor is provided
-                if sensor:
-                    if sensor not in sensors:
-                        st.error(f"Sensor '{sensor}' not found in room '{room}'.")
-                        return
-                    sensors_to_plot = {sensor: sensors[sensor]}
-                else:
-                    # If no specific sensor is provided, plot all sensors
-                    sensors_to_plot = sensors
-
-                for sensor_name, details in sensors_to_plot.items():
-                    history = details["history"]
-
-                    # Extract timestamps and values
-                    timestamps = [datetime.fromisoformat(entry[1].replace("Z", "")) for entry in history]
-                    values = [entry[0] for entry in history]
-
-                    # Plot actual data
-                    axes[0].plot(timestamps, values, label=f"{sensor_name} ({details['unit']})")
-
-                    # Prepare data for linear regression
-                    if len(timestamps) > 1:
-                        time_numbers = np.array([(ts - timestamps[0]).total_seconds() for ts in timestamps]).reshape(-1, 1)
-                        values_array = np.array(values).reshape(-1, 1)
-
-                        # Perform linear regression
-                        model = LinearRegression()
-                        model.fit(time_numbers, values_array)
-
-                        # Generate predictions for the rest of the day
-                        future_times = [
-                            timestamps[-1] + timedelta(minutes=15 * i) for i in range(1, 17)
-                        ]  # Predict for the next 4 hours (15 min intervals)
-                        future_time_numbers = np.array(
-                            [(ft - timestamps[0]).total_seconds() for ft in future_times]
-                        ).reshape(-1, 1)
-                        predictions = model.predict(future_time_numbers).flatten()
-
-                        # Plot the prognosis
-                        axes[1].plot(
-                            future_times, predictions, label=f"Prognosis: {sensor_name} ({details['unit']})",
-                            linestyle="--"
-                        )
-
-        # Configure the first graph (historical data)
-        axes[0].set_title("Historical Data")
-        axes[0].set_ylabel("Sensor Values")
-        axes[0].set_xlabel("Timestamp")
-        axes[0].legend()
-        axes[0].grid(True)
-
-        # Configure the second graph (prognosis)
-        axes[1].set_title("Prognosis for the Rest of the Day")
-        axes[1].set_xlabel("Timestamp")
-        axes[1].set_ylabel("Sensor Values")
-        axes[1].legend()
-        axes[1].grid(True)
-
-        # Display the plots in Streamlit
-        st.pyplot(fig)
+        # If a specific sensor is provided, every multisensor of the room must have it
+        sensor_ids = tuple(self.rooms_to_sensor_ids[room])
+        if sensor:
+            for sensor_id in sensor_ids:
+                if sensor not in self.data[sensor_id]["sensors"]:
+                    st.error(f"Sensor '{sensor}' not found in room '{room}'.")
+                    return
+
+        # Display the (cached) data as a Vega-Lite chart: only the columns are sent to the browser,
+        # which draws the historical data solid and the prognosis dashed
+        frame = get_room_graph_frame(self.sensor_data.version, sensor, sensor_ids, self.data)
+        chart = alt.Chart(frame, title=f"Sensor Data for {room}").mark_line().encode(
+            x=alt.X("timestamp:T", title="Timestamp"),
+            y=alt.Y("value:Q", title="Sensor Values"),
+            color=alt.Color("sensor:N", title="Sensor"),
+            strokeDash=alt.StrokeDash("kind:N", title="Data"),
+        )
+        st.altair_chart(chart, use_container_width=True)
 
     def run(self):
         """Run the Streamlit dashboard."""
+        # Rerun the script every 20 seconds from a browser-side timer, so the script returns immediately
+        # and the widgets stay responsive (the data itself is refreshed by Sensor_Data)
+        st_autorefresh(interval=20_000, key="data_refresh")
+
         # Page title
         st.title("Multisensor Dashboard")
 
@@ -259,54 +403,50 @@ class Dashboard:
         selected_sensor = st.selectbox("Select Sensor", self.sensor_data.multisensor_sensors.keys(), index=0, key="overview_sensor_select")
 
         # Display the room plan image with overlaid sensor values
-        image_with_overlay = self.show_current_data(selected_sensor)
-        if image_with_overlay:
-            st.image(image_with_overlay, caption="Room Plan with Current Temperature", use_column_width=True)
+        room_plan_labels = self.show_current_data(selected_sensor)
+        if room_plan_labels:
+            # The image and its labels share one positioned block as wide as the column, so the labels'
+            # cqw offsets are measured from the image's top left corner
+            st.markdown(
+                f'<div style="position: relative; container-type: inline-size;">'
+                f'<img src="{get_room_plan_url(self.room_plan_image_path)}" alt="Room plan" '
+                f'style="display: block; width: 100%;">{room_plan_labels}</div>',
+                unsafe_allow_html=True,
+            )
+            st.caption("Room Plan with Current Temperature")
 
         # heading for explicit data
         st.header(f"Have a closer look")
 
         # get explicit room and sensor
-        room = st.selectbox("Select Room", {sensor_data["room"] for sensor_data in self.data.values()}, key="explicit_room_select")
+        room = st.selectbox("Select Room", self.room_names, key="explicit_room_select")
         sensor = st.selectbox("Select Sensor", self.sensor_data.multisensor_sensors.keys(), index=0, key="explicit_sensor_select")
         # Display detailed graph for the selected room and sensor
         self.display_room_graph(room, sensor)
 
-        # update self.data with the current sensor data periodically
-        while True:
-            self.sensor_data.update()
-            self.data = self.sensor_data.data
-
-            time.sleep(20)
-            st.rerun()  # Trigger a rerun to refresh data in Streamlit
-
     def display_sidebar(self):
         """Display sidebar with room selection and warnings."""
         st.sidebar.title("Your Location")
-        selected_room = st.sidebar.selectbox("Select Room", {sensor_data["room"] for sensor_data in self.data.values()} , key="current_room_select")
+        selected_room = st.sidebar.selectbox("Select Room", self.room_names, key="current_room_select")
 
         # Display current sensor values and warnings for the selected room
         st.sidebar.header("Warnings for this room")
 
-        # Show warnings for the selected room
-        for sensor_id, sensor_data in self.data.items():
-            # Check if the room matches the selected room
-            if sensor_data["room"] == selected_room:
-                for sensor_name, details in sensor_data["sensors"].items():
-                    for warning in details["warnings"]:  # Iterate through warnings
-                        st.sidebar.warning(f"{sensor_name}: {warning}")
+        # Show warnings for the selected room (only its multisensors are visited)
+        for sensor_id in self.rooms_to_sensor_ids[selected_room]:
+            for sensor_name, details in self.data[sensor_id]["sensors"].items():
+                for warning in details["warnings"]:  # Iterate through warnings
+                    st.sidebar.warning(f"{sensor_name}: {warning}")
 
         st.sidebar.header("Current Sensor Values")
 
         # Show current sensor values for the selected room
-        for sensor_id, sensor_data in self.data.items():
-            # Check if the room matches the selected room
-            if sensor_data["room"] == selected_room:
-                for sensor_name, details in sensor_data["sensors"].items():
-                    current_value = details["current_value"]
-                    unit = details["unit"]
-                    if current_value is not None:
-                        st.sidebar.metric(sensor_name, f"{current_value:.1f} {unit}")
+        for sensor_id in self.rooms_to_sensor_ids[selected_room]:
+            for sensor_name, details in self.data[sensor_id]["sensors"].items():
+                current_value = details["current_value"]
+                unit = details["unit"]
+                if current_value is not None:
+                    st.sidebar.metric(sensor_name, f"{current_value:.1f} {unit}")
 
 
 # Run the dashboard
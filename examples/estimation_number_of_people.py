@@ -1,3 +1,5 @@
+import numpy as np
+
 #Estimation based on CO₂ Concentration
 #Inputs: Current CO₂ concentration, baseline CO₂, room volume, emission rate per person - standard CO₂ emission rates (~18 L/h per person).
 ###########################################################################################################################################
@@ -7,19 +9,19 @@ def estimate_people_co2(current_co2, baseline_co2, room_volume, emission_rate=18
     Estimate the number of people in a room using CO₂ concentration.
     
     Parameters:
-        current_co2 (float): Current CO₂ concentration in ppm.
-        baseline_co2 (float): Baseline CO₂ concentration (empty room) in ppm.
-        room_volume (float): Volume of the room in cubic meters.
+        current_co2 (float or np.ndarray): Current CO₂ concentration in ppm.
+        baseline_co2 (float or np.ndarray): Baseline CO₂ concentration (empty room) in ppm.
+        room_volume (float or np.ndarray): Volume of the room in cubic meters.
         emission_rate (float): CO₂ emission rate per person in L/hour (default ~18).
         time_elapsed (float): Time elapsed since measurement in seconds.
     
     Returns:
-        float: Estimated number of people.
+        float or np.ndarray: Estimated number of people (element-wise for array inputs).
     """
     co2_diff = current_co2 - baseline_co2  # ppm
     co2_produced = co2_diff * room_volume / 1000  # Convert ppm to liters
     people_count = co2_produced / (emission_rate * (time_elapsed / 3600))  # Convert time to hours
-    return max(0, people_count)  # Ensure non-negative count
+    return np.maximum(0.0, people_count)  # Ensure non-negative count (element-wise)
 
 # Example usage
 current_co2 = 600  # ppm
@@ -40,16 +42,16 @@ def estimate_people_noise(current_noise_level, baseline_noise_level, scaling_fac
     Estimate the number of people in a room using noise levels.
     
     Parameters:
-        current_noise_level (float): Current noise level (e.g., volume).
-        baseline_noise_level (float): Baseline noise level in the empty room.
+        current_noise_level (float or np.ndarray): Current noise level (e.g., volume).
+        baseline_noise_level (float or np.ndarray): Baseline noise level in the empty room.
         scaling_factor (float): Empirical scaling factor for mapping noise to people.
     
     Returns:
-        float: Estimated number of people.
+        float or np.ndarray: Estimated number of people (element-wise for array inputs).
     """
     noise_ratio = current_noise_level / baseline_noise_level
     people_count = (noise_ratio - 1) * scaling_factor
-    return max(0, people_count)
+    return np.maximum(0.0, people_count)
 
 # Example usage
 current_noise_level = 60  # dB
@@ -101,16 +103,16 @@ def estimate_people_iaq(current_iaq, baseline_iaq, scaling_factor=2.0):
     Estimate the number of people in a room using IAQ.
     
     Parameters:
-        current_iaq (float): Current IAQ index.
-        baseline_iaq (float): Baseline IAQ index for an empty room.
+        current_iaq (float or np.ndarray): Current IAQ index.
+        baseline_iaq (float or np.ndarray): Baseline IAQ index for an empty room.
         scaling_factor (float): Empirical scaling factor for mapping IAQ to people.
     
     Returns:
-        float: Estimated number of people.
+        float or np.ndarray: Estimated number of people (element-wise for array inputs).
     """
     iaq_diff = current_iaq - baseline_iaq
     people_count = iaq_diff * scaling_factor
-    return max(0, people_count)
+    return np.maximum(0.0, people_count)
 
 # Example usage
 current_iaq = 150  # IAQ index
@@ -126,8 +128,6 @@ print(f"Estimated People (IAQ): {estimate_people_iaq(current_iaq, baseline_iaq):
 
 ################################################################################################################################
 
-import numpy as np
-
 # Input Data
 co2_values = [1023.1, 1304.2, 1406.9, 1133.4, 982.8, 1015.7, 951.8, 811.7]  # ppm
 noise_levels = [147.97, 109.07, 112.39, 163.8, 168.36, 273.01, 158.09, 152.94]  # Volume
@@ -164,11 +164,10 @@ temp_diff = avg_temp - baseline_temp
 humidity_diff = avg_humidity - baseline_humidity
 temp_humidity_people = (temp_diff * temp_factor) + (humidity_diff * humidity_factor)
 
-# Sensor Fusion
-weights = [0.4, 0.3, 0.3]  # Adjust as needed
-final_people_count = (weights[0] * co2_people +
-                      weights[1] * noise_people +
-                      weights[2] * temp_humidity_people)
+# Sensor Fusion: weighted sum of the estimates as one dot product (works the same for arrays of
+# estimates per room/timestep, which stack into a (3, N) matrix)
+weights = np.array([0.4, 0.3, 0.3])  # Adjust as needed
+final_people_count = weights @ np.stack([co2_people, noise_people, temp_humidity_people])
 
 # Output Results
 print(f"Estimated People (CO2): {co2_people:.2f}")
@@ -1,9 +1,90 @@
 from influxdb import InfluxDBClient
+import numpy as np
+
+# Record layout of a sensor history: value and ISO 8601 timestamp (as returned by InfluxDB)
+HISTORY_DTYPE = np.dtype([('value', 'f8'), ('time', 'U32')])
+
+# Multisensor 115 - Conference-Space
+# Multisensor 108 - zwischen Conference-Space und Robot-Space
+# Multisensor 107 - Robot-Space
+# Multisensor 114 - Empfang
+# Multisensor 110 - zwischen Empfang und Focus-Space
+# Multisensor 109 - Focus-Space
+# Multisensor 104 - Experience-Hub
+# Multisensor 106 - Design-Thinking-Space
+# Multisensor 111 - Co-Working-Space (Left in Picture)
+# Multisensor 103 - Co-Working-Space ( Right in Picture)
+# Multisensor 113 - Social Lounge
+# Multisensor 112 - Hallway
+# Multisensor 105 - 3D Printing-Space
+
+# List of entity names to query
+ENTITIES = [
+    "multisensor_115",
+    "multisensor_108",
+    "multisensor_107",
+    "multisensor_114",
+    "multisensor_110",
+    "multisensor_109",
+    "multisensor_104",
+    "multisensor_106",
+    "multisensor_111",
+    "multisensor_103",
+    "multisensor_113",
+    "multisensor_112",
+    "multisensor_105"
+]
+
+MULTISENSOR_SENSORS = [
+    ['% rel.', ''],  # ?
+    ['ADC-Value', ''],  # ?
+    ['IAQ', ''],  # ?
+    ['W', ''],  # ?
+    ['cm', ''],  # ?
+    ['lux', ''],  # ?
+    ['m', ''],  # ?
+    ['mbar', ''],  # ?
+    ['ms', ''],  # ?
+    ['%', '_humidity'],
+    ['°C', '_temperature'],
+    ['ppm', '_scd30_co2'],
+    ['ppm', '_scd30_co2'],
+    ['IAQ', '_bme680_iaq'],
+    ['K', '_apds9960_color_temperature'],
+    ['UVI', '_ltr390_uv_index'],
+    ['V', '_microphone_voltage'],
+    ['Volume', '_microphone_noise_level'],
+    ['hPa', '_bme680_pressure'],
+    ['lx', '_ltr390_light'],
+    ['Ω', '_bme680_gas_resistance'],
+]
 
 
 class InfluxDB():
     def __init__(self):
         self.client = self.get_connection()
+        self._queries = self.build_queries()
+
+    def build_queries(self):  # builds the (static) query of every measurement once
+        queries = []  # (sensor, entity_by_id, query) per measurement
+        for sensor in MULTISENSOR_SENSORS:
+            if sensor[1]:
+                # Known sensor suffix: match the full entity_ids exactly, which uses the tag index
+                # instead of evaluating a regex against every series
+                entity_by_id = {f"{entity}{sensor[1]}": entity for entity in ENTITIES}
+                condition = " OR ".join(f"\"entity_id\" = '{entity_id}'" for entity_id in entity_by_id)
+            else:
+                # Unknown suffix: partial entity match
+                entity_by_id = None
+                condition = f"\"entity_id\" =~ /({'|'.join(ENTITIES)})/"
+            query = f"""
+            SELECT time, entity_id, value FROM "{sensor[0]}" 
+            WHERE {condition} 
+            GROUP BY "entity_id" 
+            ORDER BY time DESC LIMIT 10
+            """
+            queries.append((sensor, entity_by_id, query))
+        return queries
 
     def get_connection(self):  # connecting with the InfluxDB
         username = "api_user_2"  # 'home_assistant'
@@ -13,86 +94,47 @@ class InfluxDB():
         return client
 
     def get_historic_sensor_data(self, data_dict=None):  # gets the historic sensordata and updates the dictionary
-        # Multisensor 115 - Conference-Space
-        # Multisensor 108 - zwischen Conference-Space und Robot-Space
-        # Multisensor 107 - Robot-Space
-        # Multisensor 114 - Empfang
-        # Multisensor 110 - zwischen Empfang und Focus-Space
-        # Multisensor 109 - Focus-Space
-        # Multisensor 104 - Experience-Hub
-        # Multisensor 106 - Design-Thinking-Space
-        # Multisensor 111 - Co-Working-Space (Left in Picture)
-        # Multisensor 103 - Co-Working-Space ( Right in Picture)
-        # Multisensor 113 - Social Lounge
-        # Multisensor 112 - Hallway
-        # Multisensor 105 - 3D Printing-Space
-
-        # List of entity names to query
-        entities = [
-            "multisensor_115",
-            "multisensor_108",
-            "multisensor_107",
-            "multisensor_114",
-            "multisensor_110",
-            "multisensor_109",
-            "multisensor_104",
-            "multisensor_106",
-            "multisensor_111",
-            "multisensor_103",
-            "multisensor_113",
-            "multisensor_112",
-            "multisensor_105"
-        ]
-
-        multisensor_sensors = [
-            ['% rel.', ''],  # ?
-            ['ADC-Value', ''],  # ?
-            ['IAQ', ''],  # ?
-            ['W', ''],  # ?
-            ['cm', ''],  # ?
-            ['lux', ''],  # ?
-            ['m', ''],  # ?
-            ['mbar', ''],  # ?
-            ['ms', ''],  # ?
-            ['%', '_humidity'],
-            ['°C', '_temperature'],
-            ['ppm', '_scd30_co2'],
-            ['ppm', '_scd30_co2'],
-            ['IAQ', '_bme680_iaq'],
-            ['K', '_apds9960_color_temperature'],
-            ['UVI', '_ltr390_uv_index'],
-            ['V', '_microphone_voltage'],
-            ['Volume', '_microphone_noise_level'],
-            ['hPa', '_bme680_pressure'],
-            ['lx', '_ltr390_light'],
-            ['Ω', '_bme680_gas_resistance'],
-        ]
-
-        for entity in entities:
+        # One (prebuilt) query per measurement for all entities (instead of one per entity and measurement):
+        # GROUP BY entity_id returns the newest points of every matching series
+        results = []  # (sensor, {entity: points}) per measurement
+        for sensor, entity_by_id, query in self._queries:
+            result = self.client.query(query)
+
+            # Bucket the series into the entities they belong to
+            entity_points = {}
+            for (_, tags), series_points in result.items():
+                series_points = list(series_points)
+                if entity_by_id is not None:
+                    entity_points.setdefault(entity_by_id[tags["entity_id"]], []).extend(series_points)
+                    continue
+                for entity in ENTITIES:
+                    if entity in tags["entity_id"]:
+                        entity_points.setdefault(entity, []).extend(series_points)
+            results.append((sensor, entity_points))
+
+        for entity in ENTITIES:
             entity_data_found = False
             print(f"Entity: {entity}")
-            for sensor in multisensor_sensors:
-                # Construct query for partial entity match and measurement
-                query = f"""
-                SELECT time, entity_id, value FROM "{sensor[0]}" 
-                WHERE "entity_id" = /{entity}{sensor[1]}/ 
-                ORDER BY time DESC LIMIT 10
-                """
-                result = self.client.query(query)
+            for sensor, entity_points in results:
+                # The newest 10 points of the entity across its matching series (ISO timestamps sort by time)
+                points = sorted(entity_points.get(entity, []), key=lambda point: point['time'], reverse=True)[:10]
 
                 # Process and print the result for the current entity and measurement
-                points = list(result.get_points())
                 if points:
                     entity_data_found = True
                     print(f"  Measurement '{sensor[0]}':")
-                    for point in points:
-                        time = point['time']
-                        value = point['value']
 
-                        # update the data_dictionary
+                    # update the data_dictionary: the history becomes one structured array of
+                    # (value, time) records, materialized in a single pass over the points
+                    # (null fields, returned as None, are stored as NaN)
+                    if data_dict is not None:
                         sensor_data = data_dict[entity]["sensors"][sensor[0]]
-                        sensor_data["history"].append((value, time))
+                        sensor_data["history"] = np.fromiter(
+                            ((np.nan if point['value'] is None else point['value'], point['time'])
+                             for point in points),
+                            dtype=HISTORY_DTYPE, count=len(points))
 
+                    for point in points:
                         print(f"    {point}")
 
                 if not entity_data_found:
@@ -8,19 +8,76 @@ The InfluxDB class is responsible for:
 
 The module requires access to InfluxDB credentials, which can be stored in environment variables or a secrets management service like Streamlit secrets.
 
+Functions:
+    - get_influx_client: Creates the InfluxDB client shared across Streamlit reruns and sessions.
+
+Constants:
+    - INFLUX_POOL_SIZE: Number of pooled keep-alive connections of the shared HTTP session.
+    - HISTORY_QUERY_WORKERS: Number of history requests run concurrently.
+
 Classes:
     - InfluxDB: A class for connecting to InfluxDB and querying sensor data.
 
 Methods:
     - __init__: Initializes the InfluxDB connection.
     - get_connection: Establishes the connection to the InfluxDB instance.
+    - reconnect: Replaces the shared client after a connection failure.
+    - query: Runs a query, reconnecting once if the connection broke.
     - get_historic_sensor_data: Fetches historical data for sensors and updates a given dictionary.
+    - query_entity_history: Fetches the new data of all sensors of one entity in a single request.
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
 from datetime import datetime
+from operator import itemgetter
+import threading
 from influxdb import InfluxDBClient
+from influxdb.resultset import ResultSet
+import requests
 import streamlit as st
 
+# Keep-alive connections of the shared HTTP session (also the upper bound for concurrent queries)
+INFLUX_POOL_SIZE = 16
+
+# Concurrent history requests (one per entity), each on its own pooled connection
+HISTORY_QUERY_WORKERS = min(8, INFLUX_POOL_SIZE)
+
+# Builds the (value, timestamp) history entry of a point in a single C-level call
+_value_time = itemgetter('value', 'time')
+
+# Serializes the replacement of the shared client by the concurrent history requests
+_reconnect_lock = threading.Lock()
+
+
+@st.cache_resource
+def get_influx_client():
+    """
+    Creates the InfluxDB client once and shares it across Streamlit reruns and sessions.
+
+    The client is given its own requests.Session, whose urllib3 connection pool (INFLUX_POOL_SIZE
+    keep-alive connections) is reused by every query, so subsequent queries skip the connection setup.
+
+    Returns:
+        InfluxDBClient: A client object that allows interaction with the InfluxDB database.
+    """
+
+    # Access InfluxDB secrets (e.g., using Streamlit secrets or environment variables)
+    host = st.secrets["influxdb"]["host"]
+    port = st.secrets["influxdb"]["port"]
+    username = st.secrets["influxdb"]["username"]
+    password = st.secrets["influxdb"]["password"]
+    dbname = st.secrets["influxdb"]["dbname"]
+
+
+    # Create a connection to the InfluxDB instance. The client mounts its own pooled adapter
+    # (pool_size connections, `retries` attempts per request) on the injected session.
+    session = requests.Session()
+    client = InfluxDBClient(host, port, username, password, dbname,
+                            retries=3, pool_size=INFLUX_POOL_SIZE, session=session)  # Example host and port
+    return client
+
+
 class InfluxDB:
     """
         A class to interact with an InfluxDB instance and fetch historical sensor data.
@@ -31,11 +88,17 @@ class InfluxDB:
 
         Attributes:
             client (InfluxDBClient): The InfluxDB client used to interact with the database.
+            _last_point_time (dict): The timestamp of the newest fetched point per (entity_id, sensor),
+                so subsequent queries only select the points after it.
+            _history_start (str): The start of the day the fetched histories belong to.
 
         Methods:
             __init__: Initializes the InfluxDB connection by creating a client instance.
             get_connection: Establishes a connection to the InfluxDB instance using the provided secrets.
+            reconnect: Replaces the shared client after a connection failure.
+            query: Runs a query, reconnecting once if the connection broke.
             get_historic_sensor_data: Fetches historical sensor data starting from today and updates the provided dictionary.
+            query_entity_history: Fetches the new data of all sensors of one entity in a single request.
         """
 
     def __init__(self):
@@ -46,34 +109,65 @@ class InfluxDB:
         to the InfluxDB and stores the client object for later use.
         """
         self.client = self.get_connection()
+        self._last_point_time = {}  # (entity_id, sensor) -> timestamp of the newest fetched point
+        self._history_start = None  # Start of the day of the fetched histories
 
     def get_connection(self):
         """
         Establishes a connection to the InfluxDB instance.
 
+        The client is shared (see `get_influx_client`), so every `InfluxDB` instance reuses
+        the same HTTP session instead of opening a new one.
+
         Returns:
             InfluxDBClient: A client object that allows interaction with the InfluxDB database.
         """
+        return get_influx_client()
 
-        st.secrets.file_change_listener()
-        # Access InfluxDB secrets (e.g., using Streamlit secrets or environment variables)
-        host = st.secrets["influxdb"]["host"]
-        port = st.secrets["influxdb"]["port"]
-        username = st.secrets["influxdb"]["username"]
-        password = st.secrets["influxdb"]["password"]
-        dbname = st.secrets["influxdb"]["dbname"]
+    def reconnect(self, failed_client):
+        """
+        Replaces the shared client after a connection failure.
 
+        The cached client (and its session) is closed and dropped, so the next `get_influx_client` call
+        opens a fresh connection pool for every user of the shared client. The concurrent requests that
+        failed on the same client replace it only once: the others pick up the client that replaced it
+        instead of closing the session it is retrying on.
 
-        # Create a connection to the InfluxDB instance
-        client = InfluxDBClient(host, port, username, password, dbname)  # Example host and port
-        return client
+        Parameters:
+            failed_client (InfluxDBClient): The client whose connection broke.
+        """
+        with _reconnect_lock:
+            if self.get_connection() is failed_client:
+                failed_client.close()
+                get_influx_client.clear()
+            self.client = self.get_connection()
+
+    def query(self, query, **kwargs):
+        """
+        Runs a query on the pooled connection, reconnecting once if the connection broke.
+
+        Parameters:
+            query (str): The InfluxQL query.
+            **kwargs: Further arguments of `InfluxDBClient.query`.
+
+        Returns:
+            ResultSet: The result of the query.
+        """
+        client = self.client
+        try:
+            return client.query(query, **kwargs)
+        except requests.exceptions.ConnectionError:
+            # The pooled connections are gone (e.g. InfluxDB restarted): reconnect and retry once
+            self.reconnect(client)
+            return self.client.query(query, **kwargs)
 
     def get_historic_sensor_data(self, data_dict=None):
         """
         Fetches historical sensor data from InfluxDB and updates the provided data dictionary.
 
         The method queries the InfluxDB to retrieve sensor data starting from the beginning of the current day
-        and updates the dictionary with the retrieved historical data.
+        and updates the dictionary with the retrieved historical data. Once a sensor's history was fetched,
+        later calls on the same day only select the points after its newest point and append them.
 
         Parameters:
             data_dict (dict): A dictionary containing sensor data to be updated.
@@ -98,34 +192,98 @@ class InfluxDB:
         Returns:
             None: The function updates the provided data dictionary in-place with historical data.
         """
-        # Iterate through each entity in the data dictionary
-        for entity_id, sensor_info in data_dict.items():
+        # Get the start of today in UTC (formatted in ISO 8601 format), once for all queries
+        start_of_today = f"{datetime.utcnow().date().isoformat()}T06:00:00Z"
+
+        # A new day starts with a new history, so forget the newest points of the previous day
+        if start_of_today != self._history_start:
+            self._history_start = start_of_today
+            self._last_point_time.clear()
 
-            # Iterate through each sensor in the entity
+        # Per sensor, select either the points after the newest known one or (if its history is not
+        # the one fetched last time, e.g. on the first call) the whole day. All per-sensor work (the
+        # statement, its time bound and the target sensor) is precomputed here in one flat pass, grouped
+        # by entity for the batched requests.
+        tasks = []  # (entity_id, [(sensor, details, full entity_id, statement, last_point_time or None)], bind_params)
+        for entity_id, sensor_info in data_dict.items():
+            sensors = []
+            bind_params = {"start_of_today": start_of_today}
             for sensor, details in sensor_info["sensors"].items():
-                unit = details["unit"]  # Extract the unit of measurement for the sensor
-
-                # Get the start of today in UTC (formatted in ISO 8601 format)
-                start_of_today = datetime.utcnow().strftime('%Y-%m-%dT06:00:00Z')
-
-                # Build the InfluxDB query to retrieve historical data for the sensor
-                query = f"""
-                    SELECT time, entity_id, value FROM "{unit}" 
-                    WHERE "entity_id" = '{entity_id}{details["id"]}' 
-                    AND time >= '{start_of_today}'
-                    ORDER BY time ASC
-                """
-
-                # Execute the query to fetch the historical data from InfluxDB
-                result = self.client.query(query)
-
-                # Process the results from the query
-                points = list(result.get_points())  # Convert the result to a list of data points
-                if points:
-                    entity_data_found = True  # Data was found for this sensor
-                    for point in points:
-                        time = point['time']  # Timestamp of the data point
-                        value = point['value']  # Value of the sensor at the given time
-
-                        # Append the historical data to the sensor's history in the data dictionary
-                        data_dict[entity_id]["sensors"][sensor]["history"].append((value, time))
\ No newline at end of file
+                full_entity_id = f"{entity_id}{details['id']}"
+                index = len(sensors)  # Suffix of the statement's bind parameters
+
+                # The values are passed as bind parameters (quoted by the server, no string interpolation
+                # of IDs or timestamps). Only the measurement is an identifier, which cannot be bound.
+                bind_params[f"entity_id_{index}"] = full_entity_id
+                last_time = self._last_point_time.get((entity_id, sensor))
+                history = details["history"]
+                if last_time and len(history) and history[-1][1] == last_time:
+                    bind_params[f"since_{index}"] = last_time
+                    time_condition = f"time > $since_{index}"
+                else:
+                    last_time = None
+                    time_condition = "time >= $start_of_today"
+                statement = (
+                    f"""SELECT time, entity_id, value FROM "{details["unit"]}" """
+                    f"""WHERE "entity_id" = $entity_id_{index} """
+                    f"""AND {time_condition} ORDER BY time ASC"""
+                )
+                sensors.append((sensor, details, full_entity_id, statement, last_time))
+            tasks.append((entity_id, sensors, bind_params))
+
+        # The requests are pure I/O, so run the entities' requests concurrently on the pooled
+        # connections and process each response as soon as it arrives
+        with ThreadPoolExecutor(max_workers=HISTORY_QUERY_WORKERS) as executor:
+            futures = {
+                executor.submit(self.query_entity_history, sensors, bind_params): (entity_id, sensors)
+                for entity_id, sensors, bind_params in tasks
+            }
+
+            for future in as_completed(futures):
+                # Process the results from the query. Every task owns the sensors of its entity,
+                # so no two tasks write to the same history. The dashboard reads the histories from
+                # other threads, so a history is never changed in place but replaced by a new one.
+                entity_id, sensors = futures[future]
+                for (sensor, details, full_entity_id, statement, last_time), points in zip(sensors, future.result()):
+                    if last_time:
+                        # Only the points after the newest known one were selected: keep the known points
+                        # from the start of today on and append the new ones, so that the history holds
+                        # exactly today's points however fast the sensor reports (ISO 8601 timestamps
+                        # compare in time order as strings)
+                        history = deque(point for point in details["history"] if point[1] >= start_of_today)
+                        history.extend(points)
+                        details["history"] = history
+                    else:
+                        # The whole day was selected, so replace the history instead of appending to it.
+                        # This keeps the history time-ordered and free of duplicates across updates.
+                        details["history"] = deque(points)
+
+                    if points:
+                        self._last_point_time[(entity_id, sensor)] = points[-1][1]
+
+    def query_entity_history(self, sensors, bind_params):
+        """
+        Fetches the new data of all sensors of one entity in a single request.
+
+        The statements of the sensors are sent as a single semicolon-separated request (one round
+        trip per entity instead of one per sensor).
+
+        The response holds one result per statement, in the order of the statements, so the points of
+        each result belong to the sensor of the same position. A failing statement raises
+        InfluxDBClientError instead of silently returning no points.
+
+        Parameters:
+            sensors (list): The (sensor_name, details, full entity_id, statement, last_point_time or None)
+                tuples of the entity's sensors.
+            bind_params (dict): The values of the $-placeholders of the statements.
+
+        Returns:
+            list: The (value, timestamp) points of each sensor, in the order of `sensors`.
+        """
+        # Execute the query to fetch the historical data from InfluxDB (the whole response is read inside
+        # `query`, so a connection lost while reading it is retried as well)
+        results = self.query("; ".join(sensor[3] for sensor in sensors), bind_params=bind_params)
+        if isinstance(results, ResultSet):
+            results = [results]  # The client only returns a list for more than one statement
+
+        return [list(map(_value_time, result.get_points())) for result in results]
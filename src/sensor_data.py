@@ -1,11 +1,146 @@
 import src.influx_db_data as idb
-from requests import get
-import random
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import copy
+import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
+from datetime import datetime
 import time
 import threading
 import streamlit as st
 
+# Mapping of sensor IDs to room names
+_SENSOR_ROOM_MAPPING = {
+    "multisensor_115": "Conference-Space",
+    "multisensor_108": "zwischen Conference-Space und Robot-Space",
+    "multisensor_107": "Robot-Space",
+    "multisensor_114": "Empfang",
+    "multisensor_110": "zwischen Empfang und Focus-Space",
+    "multisensor_109": "Focus-Space",
+    "multisensor_104": "Experience-Hub",
+    "multisensor_106": "Design-Thinking-Space",
+    "multisensor_111": "Co-Working-Space (Left in Picture)",
+    "multisensor_103": "Co-Working-Space (Right in Picture)",
+    "multisensor_113": "Social Lounge",
+    "multisensor_112": "Hallway",
+    "multisensor_105": "3D Printing-Space",
+}
+
+# Mapping of room names to their respective volumes (calculated by room area * height)
+_ROOM_VOLUME = {
+    "Conference-Space": (21.06 * 3.2),
+    "zwischen Conference-Space und Robot-Space": (14.04 * 3.2),
+    "Robot-Space": (30.03 * 3.2),
+    "Empfang": (31.27 * 3.2),
+    "zwischen Empfang und Focus-Space": (13.26 * 3.2),
+    "Focus-Space": (50.7 * 3.2),
+    "Experience-Hub": (88.27 * 3.2),
+    "Design-Thinking-Space": (43.86 * 3.2),
+    "Co-Working-Space (Left in Picture)": (48 * 3.2),
+    "Co-Working-Space (Right in Picture)": (46.35 * 3.2),
+    "Social Lounge": (34.74 * 3.2),
+    "Hallway": 0,
+    "3D Printing-Space": 0,
+}
+
+# Sensor details including sensor ID and measurement units
+_MULTISENSOR_SENSORS = {
+    "Humidity": {"id": "_humidity", "unit": "%"},
+    "Temperature": {"id": "_temperature", "unit": "°C"},
+    "CO2": {"id": "_scd30_co2", "unit": "ppm"},
+    "IAQ": {"id": "_bme680_iaq", "unit": "IAQ"},
+    "UV Index": {"id": "_ltr390_uv_index", "unit": "UVI"},
+    "Microphone Noise Level": {"id": "_microphone_noise_level", "unit": "Volume"},
+    "Pressure": {"id": "_bme680_pressure", "unit": "hPa"},
+    "Light": {"id": "_ltr390_light", "unit": "lx"},
+    "Gas Resistance": {"id": "_bme680_gas_resistance", "unit": "Ω"},
+    "Occupancy": {"id": "_people", "unit": "People"}
+}
+
+
+# Sensor IDs (entity_id suffixes) and units of the multisensors in Home Assistant
+_HA_SENSOR_MAP = {
+    "Detection Distance": {"id": "_ld2410_detection_distance", "unit": "cm"},
+    "TOF Distance": {"id": "_tof_distance", "unit": "m"},
+    "Humidity": {"id": "_bme680_humidity", "unit": "%"},
+    "Temperature": {"id": "_bme680_temperature", "unit": "°C"},
+    "CO2": {"id": "_scd30_co2", "unit": "ppm"},
+    "IAQ": {"id": "_bme680_iaq", "unit": "IAQ"},
+    "UV Index": {"id": "_ltr390_uv_index", "unit": "UVI"},
+    "Microphone Voltage": {"id": "_microphone_voltage", "unit": "V"},
+    "Microphone Noise Level": {"id": "_microphone_noise_level", "unit": "Volume"},
+    "Pressure": {"id": "_bme680_pressure", "unit": "hPa"},
+    "Light": {"id": "_ltr390_light", "unit": "lx"},
+    "Gas Resistance": {"id": "_bme680_gas_resistance", "unit": "Ω"}
+}
+
+def _build_ha_to_target():
+    """
+    Maps the Home Assistant entity_id of every sensor of the known multisensors to the sensor it updates.
+
+    An entity_id (e.g. sensor.multisensor_110_scd30_co2) is split into the multisensor ID (multisensor_110)
+    and a sensor type ID made of its parts after the chip name (_co2), and mapped to the first sensor
+    whose ID contains that type ID (CO2 with _scd30_co2). Entities without a matching sensor are left out.
+
+    Returns:
+        dict: entity_id -> (sensor_id, sensor_name).
+    """
+    targets = {}
+    for sensor_id in _SENSOR_ROOM_MAPPING:
+        for details in _HA_SENSOR_MAP.values():
+            entity_id = f"sensor.{sensor_id}{details['id']}"
+
+            # Parse entity_id to get sensor_id and sensor_type
+            parts = entity_id.split("_")
+            parsed_sensor_id = "_".join(parts[0].split(".")[1:] + parts[1:2])  # e.g., multisensor_110
+            sensor_type_id = "_" + "_".join(parts[3:])  # e.g., _noise_level
+
+            for sensor_name, sensor_details in _MULTISENSOR_SENSORS.items():
+                if sensor_type_id in sensor_details["id"]:
+                    targets[entity_id] = (parsed_sensor_id, sensor_name)
+                    break
+    return targets
+
+
+# Built once at import, so a live state is applied with a single dict lookup instead of parsing its entity_id
+_HA_TO_TARGET = _build_ha_to_target()
+
+
+def _build_sensor_dict_template():
+    """
+    Builds the sensor dictionary of all rooms once, as the template copied by `Sensor_Data.create_sensor_dict`.
+
+    Returns:
+        dict: A dictionary containing all the (empty) sensor data and room associations.
+    """
+    # Initialize the final data structure to hold all sensor data
+    sensors_data = {}
+
+    # Iterate over each sensor and room to populate the data structure
+    for sensor_id, room in _SENSOR_ROOM_MAPPING.items():
+        sensors_data[sensor_id] = {
+            "room": room,  # Room associated with the sensor
+            "sensors": {
+                sensor_name: {  # For each sensor in the multisensor
+                    "unit": details["unit"],  # Unit of the sensor
+                    "id": details["id"],  # Sensor ID
+                    "current_value": None,  # Current value (None initially)
+                    "history": deque(),  # History of today's readings (empty initially)
+                    "warnings": []  # Warnings related to the sensor (empty initially)
+                }
+                for sensor_name, details in _MULTISENSOR_SENSORS.items()  # Iterate over all available sensor types
+            },
+            "volume": _ROOM_VOLUME[room]  # Volume of the room (associated with the room)
+        }
+
+    return sensors_data
+
+
+# Built once at import, every Sensor_Data gets its own deep copy
+_SENSOR_DICT_TEMPLATE = _build_sensor_dict_template()
+
+
 class Sensor_Data():
     """
     A class that handles the management of sensor data, including fetching live data,
@@ -14,6 +149,11 @@ class Sensor_Data():
     Attributes:
         data (dict): A dictionary containing sensor data for all rooms.
         influxDB (InfluxDB): An instance of the InfluxDB class used to fetch historic data.
+        _session (requests.Session): The pooled HTTP session for the Home Assistant API.
+        _last_updated (dict): The last_updated timestamp of the applied Home Assistant state per entity_id,
+            so unchanged states are skipped.
+        version (int): Incremented whenever an update ingests new data, so consumers can cache
+            derived results on it instead of on the data itself.
     """
 
     def __init__(self):
@@ -22,6 +162,16 @@ class Sensor_Data():
         data updates at regular intervals.
         """
         self.data = self.create_sensor_dict()  # Creates a dictionary for all rooms and their multisensors
+        self.version = 0  # Data version, incremented by update() when new data arrives
+        self.influxDB = None  # InfluxDB connection, created on the first update and reused afterwards
+        self._last_updated = {}  # Home Assistant entity_id -> last_updated of the applied state
+
+        # HTTP session for the Home Assistant API, so every fetch reuses its pooled keep-alive connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
         self.update()  # Fetches and updates data
         self.schedule_data_updates()  # Schedules periodic data updates
 
@@ -29,13 +179,24 @@ class Sensor_Data():
         """
         Updates the sensor data by fetching live data from Home Assistant and historic data
         from InfluxDB. Also updates occupancy values.
+
+        Returns:
+            int: The data version, incremented if the update changed any current value or history.
         """
+        signature = self.data_signature()
         try:
-            self.fetch_live_data()  # Updates self.data with live sensor data from Home Assistant
+            # Both fetches are network-bound and write different fields (current values vs. histories),
+            # so the live data is fetched in a helper thread while the historic data is fetched here
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                live_data = executor.submit(self.fetch_live_data)  # Updates self.data with live sensor data from Home Assistant
+
+                # Create the InfluxDB instance once (inside the try, so missing credentials still fall back
+                # to sample data) and fetch historic sensor data
+                if self.influxDB is None:
+                    self.influxDB = idb.InfluxDB()
+                self.influxDB.get_historic_sensor_data(self.data)  # Updates self.data with historic data from InfluxDB
 
-            # Create an instance of InfluxDB and fetch historic sensor data
-            self.influxDB = idb.InfluxDB()
-            self.influxDB.get_historic_sensor_data(self.data)  # Updates self.data with historic data from InfluxDB
+                live_data.result()  # Waits for the live data (and re-raises its errors)
 
             # Update occupancy for each room
             self.update_occupancy()
@@ -44,6 +205,28 @@ class Sensor_Data():
             print(f"Error while updating the dictionary: {e}. Generating sample data for testing")
             #TODO: remove when done with testing
             populate_sensor_data(self.data)  # Populates sample data for testing purposes
+            self._last_updated.clear()  # The sample data replaced the live values, so reapply all states
+
+        # Only bump the version if new points were actually ingested
+        if self.data_signature() != signature:
+            self.version += 1
+        return self.version
+
+    def data_signature(self):
+        """
+        Builds a cheap fingerprint of the sensor data to detect new points between updates.
+
+        The histories are time-ordered and replaced on every update, so their length and newest entry
+        together with the current value identify the state of a sensor without comparing whole histories.
+
+        Returns:
+            list: One (current_value, history length, newest history entry) triple per sensor.
+        """
+        return [
+            (details["current_value"], len(details["history"]), details["history"][-1] if len(details["history"]) else None)
+            for sensor_info in self.data.values()
+            for details in sensor_info["sensors"].values()
+        ]
 
     def schedule_data_updates(self):
         """
@@ -84,35 +267,46 @@ class Sensor_Data():
         else:
             return 0  # Return 0 if no valid CO2 data
 
-    def update_occupancy(self):
+    def update_occupancy(self, baseline_co2=550, emission_rate=18, time_elapsed=3600):
         """
         Updates the occupancy data for each room based on the current CO₂ concentration.
+
+        The estimate of `calculate_occupancy` is computed for all rooms at once on NumPy arrays of
+        their CO₂ values and (constant) volumes.
+
+        Parameters:
+            baseline_co2 (float): The baseline CO₂ concentration (in ppm) for an empty room (default ~550 ppm).
+            emission_rate (float): The CO₂ emission rate per person (in L/hour) (default ~18).
+            time_elapsed (float): The time elapsed since measurement (in seconds, default 3600 seconds).
         """
-        for room_id, sensor_info in self.data.items():
-            # Check if 'Occupancy' exists in the sensors dictionary for the room
-            if "Occupancy" in sensor_info["sensors"]:
-                # Update the current occupancy value based on CO₂ calculations
-                sensor_info["sensors"]["Occupancy"]["current_value"] = self.calculate_occupancy(room_id)
+        # Rooms with an 'Occupancy' sensor
+        rooms = [sensor_info for sensor_info in self.data.values() if "Occupancy" in sensor_info["sensors"]]
+        if not rooms:
+            return
+
+        # Current CO₂ concentrations in ppm and room volumes in cubic meters (truncated like int())
+        current_co2 = np.fromiter((float(room["sensors"]["CO2"]["current_value"]) for room in rooms),
+                                  dtype=np.float64, count=len(rooms))
+        room_volume = np.trunc(np.fromiter((self.room_volume[room["room"]] for room in rooms),
+                                           dtype=np.float64, count=len(rooms)))
+
+        # CO₂ produced in liters per person and hour (the same for all rooms)
+        co2_per_person = emission_rate * (time_elapsed / 3600)  # Convert time to hours
+
+        # Estimated number of people (non-negative, 0 if no valid CO₂ data)
+        people_count = np.maximum(0, np.round((current_co2 - baseline_co2) * room_volume / 1000 / co2_per_person))
+        people_count[current_co2 == 0] = 0
+
+        # Update the current occupancy values
+        for room, count in zip(rooms, people_count.astype(int).tolist()):
+            room["sensors"]["Occupancy"]["current_value"] = count
 
     def fetch_live_data(self):
         """
         Fetches live data from the Home Assistant API and updates the sensor data in the system.
-        """
-        multisensor_sensors_home_assistant = {
-            "Detection Distance": {"id": "_ld2410_detection_distance", "unit": "cm"},
-            "TOF Distance": {"id": "_tof_distance", "unit": "m"},
-            "Humidity": {"id": "_bme680_humidity", "unit": "%"},
-            "Temperature": {"id": "_bme680_temperature", "unit": "°C"},
-            "CO2": {"id": "_scd30_co2", "unit": "ppm"},
-            "IAQ": {"id": "_bme680_iaq", "unit": "IAQ"},
-            "UV Index": {"id": "_ltr390_uv_index", "unit": "UVI"},
-            "Microphone Voltage": {"id": "_microphone_voltage", "unit": "V"},
-            "Microphone Noise Level": {"id": "_microphone_noise_level", "unit": "Volume"},
-            "Pressure": {"id": "_bme680_pressure", "unit": "hPa"},
-            "Light": {"id": "_ltr390_light", "unit": "lx"},
-            "Gas Resistance": {"id": "_bme680_gas_resistance", "unit": "Ω"}
-        }
 
+        Only the states that changed since the previous fetch (by their `last_updated` timestamp) are applied.
+        """
         # Access API secrets
         url_zeki = st.secrets["api"]["url_zeki"]
         headers_zeki = {
@@ -120,52 +314,35 @@ class Sensor_Data():
             "content-type": st.secrets["api"]["content_type"],
         }
 
-
-        def update_sensor_value(sensors_data, target_sensor_id, target_id, new_value):
-            """
-            Updates the current value for a sensor in the sensors dictionary.
-
-            Args:
-                sensors_data (dict): The sensors data dictionary.
-                target_sensor_id (str): The sensor ID to update.
-                target_id (str): The sensor attribute ID to match.
-                new_value: The new value to set for the sensor.
-            """
-            if target_sensor_id in sensors_data:
-                sensors = sensors_data[target_sensor_id]["sensors"]
-                for sensor_name, sensor_details in sensors.items():
-                    if target_id in sensor_details["id"]:
-                        sensor_details["current_value"] = new_value
-                        return
-
-        response = get(url_zeki, headers=headers_zeki)
+        response = self._session.get(url_zeki, headers=headers_zeki, timeout=10)
         if response.ok:
             all_states = response.json()
 
-            valid_suffixes = [details["id"] for details in multisensor_sensors_home_assistant.values()]
-            multisensor_entities = [
-                entity for entity in all_states
-                if entity['entity_id'].startswith("sensor.multisensor_") and
-                   any(entity['entity_id'].endswith(suffix) for suffix in valid_suffixes)
-            ]
-
-            # Update self.data with the latest live sensor values
-            for entity in multisensor_entities:
+            # Update self.data with the latest live sensor values, skipping the states that did not
+            # change since the previous fetch (Home Assistant bumps last_updated on every state change)
+            for entity in all_states:
+                # A single hashed lookup per state finds the sensor it updates (if any)
                 entity_id = entity["entity_id"]
-                entity_state = entity["state"]
+                target = _HA_TO_TARGET.get(entity_id)
+                if target is None:
+                    continue
 
-                # Parse entity_id to get sensor_id and sensor_type
-                parts = entity_id.split("_")
-                sensor_id = "_".join(parts[0].split(".")[1:] + parts[1:2])  # e.g., multisensor_110
-                sensor_type_id = "_" + "_".join(parts[3:])  # e.g., _microphone_noise_level
+                last_updated = entity.get("last_updated")
+                if last_updated is not None and self._last_updated.get(entity_id) == last_updated:
+                    continue
+                self._last_updated[entity_id] = last_updated
 
-                update_sensor_value(self.data, sensor_id, sensor_type_id, entity_state)
+                sensor_id, sensor_name = target
+                self.data[sensor_id]["sensors"][sensor_name]["current_value"] = entity["state"]
 
     def create_sensor_dict(self):
         """
         Initializes and creates a dictionary structure that maps sensors to rooms, including the sensor data,
         their current values, history, and warnings. It also associates each room with its respective volume.
 
+        The structure is built once at import (see `_build_sensor_dict_template`), so this returns a deep copy
+        of the template with fresh mutable leaves (`current_value`, `history`, `warnings`).
+
         This dictionary is structured as follows:
         - Each sensor is mapped to a room.
         - Each sensor has information about its type, unit, current value, history, and warnings.
@@ -174,76 +351,27 @@ class Sensor_Data():
         Returns:
             dict: A dictionary containing all the sensor data and room associations.
         """
+        # Constant maps shared by all instances (read-only)
+        self.room_volume = _ROOM_VOLUME  # Mapping of room names to their respective volumes
+        self.multisensor_sensors = _MULTISENSOR_SENSORS  # Sensor details including sensor ID and measurement units
 
-        # Mapping of sensor IDs to room names
-        sensor_room_mapping = {
-            "multisensor_115": "Conference-Space",
-            "multisensor_108": "zwischen Conference-Space und Robot-Space",
-            "multisensor_107": "Robot-Space",
-            "multisensor_114": "Empfang",
-            "multisensor_110": "zwischen Empfang und Focus-Space",
-            "multisensor_109": "Focus-Space",
-            "multisensor_104": "Experience-Hub",
-            "multisensor_106": "Design-Thinking-Space",
-            "multisensor_111": "Co-Working-Space (Left in Picture)",
-            "multisensor_103": "Co-Working-Space (Right in Picture)",
-            "multisensor_113": "Social Lounge",
-            "multisensor_112": "Hallway",
-            "multisensor_105": "3D Printing-Space",
-        }
-
-        # Mapping of room names to their respective volumes (calculated by room area * height)
-        self.room_volume = {
-            "Conference-Space": (21.06 * 3.2),
-            "zwischen Conference-Space und Robot-Space": (14.04 * 3.2),
-            "Robot-Space": (30.03 * 3.2),
-            "Empfang": (31.27 * 3.2),
-            "zwischen Empfang und Focus-Space": (13.26 * 3.2),
-            "Focus-Space": (50.7 * 3.2),
-            "Experience-Hub": (88.27 * 3.2),
-            "Design-Thinking-Space": (43.86 * 3.2),
-            "Co-Working-Space (Left in Picture)": (48 * 3.2),
-            "Co-Working-Space (Right in Picture)": (46.35 * 3.2),
-            "Social Lounge": (34.74 * 3.2),
-            "Hallway": 0,
-            "3D Printing-Space": 0,
-        }
+        return copy.deepcopy(_SENSOR_DICT_TEMPLATE)
 
-        # Sensor details including sensor ID and measurement units
-        self.multisensor_sensors = {
-            "Humidity": {"id": "_humidity", "unit": "%"},
-            "Temperature": {"id": "_temperature", "unit": "°C"},
-            "CO2": {"id": "_scd30_co2", "unit": "ppm"},
-            "IAQ": {"id": "_bme680_iaq", "unit": "IAQ"},
-            "UV Index": {"id": "_ltr390_uv_index", "unit": "UVI"},
-            "Microphone Noise Level": {"id": "_microphone_noise_level", "unit": "Volume"},
-            "Pressure": {"id": "_bme680_pressure", "unit": "hPa"},
-            "Light": {"id": "_ltr390_light", "unit": "lx"},
-            "Gas Resistance": {"id": "_bme680_gas_resistance", "unit": "Ω"},
-            "Occupancy": {"id": "_people", "unit": "People"}
-        }
 
-        # Initialize the final data structure to hold all sensor data
-        sensors_data = {}
-
-        # Iterate over each sensor and room to populate the data structure
-        for sensor_id, room in sensor_room_mapping.items():
-            sensors_data[sensor_id] = {
-                "room": room,  # Room associated with the sensor
-                "sensors": {
-                    sensor_name: {  # For each sensor in the multisensor
-                        "unit": self.multisensor_sensors[sensor_name]["unit"],  # Unit of the sensor
-                        "id": self.multisensor_sensors[sensor_name]["id"],  # Sensor ID
-                        "current_value": None,  # Current value (None initially)
-                        "history": [],  # History of readings (empty initially)
-                        "warnings": []  # Warnings related to the sensor (empty initially)
-                    }
-                    for sensor_name in self.multisensor_sensors  # Iterate over all available sensor types
-                },
-                "volume": self.room_volume[room]  # Volume of the room (associated with the room)
-            }
-
-        return sensors_data
+# Random sample generators per sensor type: (rng, size) -> NumPy array of values (one NumPy call per sensor,
+# upper bounds of the integer ranges are inclusive like random.randint)
+SAMPLERS = {
+    "Temperature": lambda rng, size: rng.uniform(18.0, 26.0, size).round(1),  # Temperature in °C
+    "Humidity": lambda rng, size: rng.integers(30, 70, size, endpoint=True),  # Humidity in %
+    "CO2": lambda rng, size: rng.integers(400, 1000, size, endpoint=True),  # CO2 in ppm
+    "Pressure": lambda rng, size: rng.uniform(950.0, 1050.0, size).round(1),  # Pressure in hPa
+    "Light": lambda rng, size: rng.integers(100, 1000, size, endpoint=True),  # Light in lx
+    "UV Index": lambda rng, size: rng.uniform(0.0, 10.0, size).round(1),  # UV Index
+    "Gas Resistance": lambda rng, size: rng.integers(100, 10000, size, endpoint=True),  # Gas Resistance in Ω
+    "IAQ": lambda rng, size: rng.integers(0, 500, size, endpoint=True),  # IAQ (Indoor Air Quality) index
+    "Microphone Noise Level": lambda rng, size: rng.uniform(20.0, 80.0, size).round(1),  # Noise level in Volume
+    "Occupancy": lambda rng, size: rng.integers(0, 10, size, endpoint=True),  # Number of people in the room
+}
 
 
 def populate_sensor_data(data):
@@ -261,46 +389,25 @@ def populate_sensor_data(data):
     Returns:
         None: This function updates the 'data' dictionary in place.
     """
-    current_time = datetime.utcnow()
-    today_date = current_time.strftime('%Y-%m-%d')
+    start_of_today = np.datetime64(datetime.utcnow().date(), "s") + np.timedelta64(6, "h")  # 6:00 AM UTC
+    rng = np.random.default_rng()
+    size = 24  # 24 timestamps for 12 hours (6:00 AM to 6:00 PM)
 
-    # Generate timestamps for every 30 minutes starting at 6:00 AM
-    timestamps = [
-        (datetime.strptime(f"{today_date}T06:00:00Z", '%Y-%m-%dT%H:%M:%SZ') +
-         timedelta(minutes=30 * i)).strftime('%Y-%m-%dT%H:%M:%SZ')
-        for i in range(24)  # 24 timestamps for 12 hours (6:00 AM to 6:00 PM)
-    ]
+    # Generate timestamps for every 30 minutes starting at 6:00 AM (as one datetime64 range, formatted
+    # and suffixed with "Z" in single vectorized calls)
+    timestamps = np.char.add(
+        np.datetime_as_string(start_of_today + np.arange(size) * np.timedelta64(30, "m")), "Z"
+    ).tolist()
 
     # Iterate through each sensor and populate with random values
     for sensor_id, sensor_info in data.items():
         for sensor_name, sensor_data in sensor_info["sensors"].items():
             # Generate random data based on the sensor type
-            if "Temperature" in sensor_name:
-                values = [round(random.uniform(18.0, 26.0), 1) for _ in timestamps]  # Temperature in °C
-            elif "Humidity" in sensor_name:
-                values = [random.randint(30, 70) for _ in timestamps]  # Humidity in %
-            elif "CO2" in sensor_name:
-                values = [random.randint(400, 1000) for _ in timestamps]  # CO2 in ppm
-            elif "Pressure" in sensor_name:
-                values = [round(random.uniform(950.0, 1050.0), 1) for _ in timestamps]  # Pressure in hPa
-            elif "Light" in sensor_name:
-                values = [random.randint(100, 1000) for _ in timestamps]  # Light in lx
-            elif "UV Index" in sensor_name:
-                values = [round(random.uniform(0.0, 10.0), 1) for _ in timestamps]  # UV Index
-            elif "Gas Resistance" in sensor_name:
-                values = [random.randint(100, 10000) for _ in timestamps]  # Gas Resistance in Ω
-            elif "IAQ" in sensor_name:
-                values = [random.randint(0, 500) for _ in timestamps]  # IAQ (Indoor Air Quality) index
-            elif "Microphone Noise Level" in sensor_name:
-                values = [round(random.uniform(20.0, 80.0), 1) for _ in timestamps]  # Noise level in Volume
-            elif "Occupancy" in sensor_name:
-                values = [random.randint(0, 10) for _ in timestamps]  # Number of people in the room
-            else:
-                values = [None for _ in timestamps]  # Default case if sensor type doesn't match
+            sampler = SAMPLERS.get(sensor_name)
+            values = sampler(rng, size).tolist() if sampler else [None] * size  # None if the sensor type doesn't match
 
             # Update current value with the most recent timestamp
             sensor_data["current_value"] = values[-1]
 
             # Generate history with (value, timestamp) pairs
-            sensor_data["history"] = list(zip(values, timestamps))
-
+            sensor_data["history"] = deque(zip(values, timestamps))
@@ -0,0 +1,66 @@
+import csv
+from pathlib import Path
+import tempfile
+import unittest
+
+import numpy as np
+
+import app
+
+
+class FitLineTest(unittest.TestCase):
+    def test_matches_least_squares_for_a_single_series(self):
+        rng = np.random.default_rng(0)
+        x = np.sort(rng.uniform(0, 7200, 50))
+        y = 0.01 * x + 400 + rng.normal(0, 5, 50)
+
+        slope, intercept = app._fit_line(x, y)
+
+        np.testing.assert_allclose((slope, intercept), np.polyfit(x, y, 1))
+
+    def test_fits_a_batch_of_series_like_each_series_alone(self):
+        rng = np.random.default_rng(1)
+        x = np.tile(np.arange(20.0) * 900, (3, 1))
+        y = rng.normal(0, 1, (3, 20)) + np.arange(3)[:, None] * x
+
+        slopes, intercepts = app._fit_line(x, y)
+
+        for series in range(3):
+            np.testing.assert_allclose((slopes[series], intercepts[series]),
+                                       np.polyfit(x[series], y[series], 1))
+
+    def test_constant_x_gets_slope_zero_and_the_mean(self):
+        slope, intercept = app._fit_line(np.zeros(3), np.array([1.0, 2.0, 3.0]))
+
+        self.assertEqual((slope, intercept), (0.0, 2.0))
+
+
+class TrainingDataFileTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "training_data.csv"
+
+    def read_rows(self):
+        with open(self.path, newline='') as file:
+            return list(csv.reader(file))
+
+    def test_rows_are_on_disk_when_append_returns(self):
+        training_data = app._TrainingDataFile(self.path)
+
+        training_data.append([1] * 11)
+        self.assertEqual(self.read_rows(), [training_data.header, ["1"] * 11])
+
+        training_data.append([2] * 11)
+        self.assertEqual(self.read_rows(), [training_data.header, ["1"] * 11, ["2"] * 11])
+
+    def test_existing_file_gets_no_second_header(self):
+        app._TrainingDataFile(self.path).append([1] * 11)
+
+        app._TrainingDataFile(self.path).append([2] * 11)
+
+        self.assertEqual(self.read_rows().count(app._TrainingDataFile.header), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
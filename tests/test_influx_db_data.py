@@ -0,0 +1,163 @@
+from collections import deque
+from datetime import datetime
+import re
+import unittest
+from unittest import mock
+
+from influxdb import InfluxDBClient
+from influxdb.exceptions import InfluxDBClientError
+from influxdb.resultset import ResultSet
+
+import src.influx_db_data as idb
+
+INFLUX_SECRETS = {
+    "host": "localhost",
+    "port": 8086,
+    "username": "user",
+    "password": "password",
+    "dbname": "homeassistant",
+}
+
+
+class GetInfluxClientTest(unittest.TestCase):
+    def setUp(self):
+        idb.get_influx_client.clear()
+        patcher = mock.patch.object(idb.st, "secrets", {"influxdb": INFLUX_SECRETS})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(idb.get_influx_client.clear)
+
+    def test_builds_client_from_secrets(self):
+        client = idb.get_influx_client()
+
+        self.assertIsInstance(client, InfluxDBClient)
+        self.assertEqual(client._host, "localhost")
+        self.assertEqual(client._port, 8086)
+        self.assertEqual(client._database, "homeassistant")
+        self.assertIs(idb.get_influx_client(), client)
+
+
+class FakeInfluxClient:
+    """Answers history statements from in-memory points, like the server does for a batched request."""
+
+    def __init__(self, points=None, errors=()):
+        self.points = points or {}  # full entity_id -> [(time, value)] in time order
+        self.errors = set(errors)  # full entity_ids whose statement fails
+        self.statements = []
+
+    def query(self, query, bind_params=None, **kwargs):
+        results = []
+        for statement_id, statement in enumerate(query.split("; ")):
+            self.statements.append(statement)
+            entity_id = bind_params[re.search(r'"entity_id" = \$(\w+)', statement).group(1)]
+            operator, name = re.search(r"time (>=?) \$(\w+)", statement).groups()
+            since = bind_params[name]
+            if entity_id in self.errors:
+                result = {"statement_id": statement_id, "error": "measurement not found"}
+            else:
+                values = [[time, entity_id, value] for time, value in self.points.get(entity_id, [])
+                          if time > since or (operator == ">=" and time == since)]
+                result = {"statement_id": statement_id}
+                if values:
+                    result["series"] = [{"name": "unit", "columns": ["time", "entity_id", "value"],
+                                         "values": values}]
+            results.append(ResultSet(result))
+        return results[0] if len(results) == 1 else results
+
+
+def sensor_details(sensor_id, history=()):
+    return {"unit": "unit", "id": sensor_id, "current_value": None, "history": deque(history), "warnings": []}
+
+
+class InfluxDBHistoryTest(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeInfluxClient()
+        patcher = mock.patch.object(idb, "get_influx_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.now = datetime(2024, 5, 1, 12, 0)
+        patcher = mock.patch.object(idb, "datetime")
+        patcher.start().utcnow.side_effect = lambda: self.now
+        self.addCleanup(patcher.stop)
+        self.db = idb.InfluxDB()
+
+    def test_query_entity_history_routes_each_result_to_its_sensor(self):
+        self.client.points = {
+            "sensor.ms_temperature": [("2024-05-01T07:00:00Z", 21.0), ("2024-05-01T08:00:00Z", 22.0)],
+            "sensor.ms_co2": [("2024-05-01T07:30:00Z", 450.0)],
+        }
+        sensors = [(name, None, f"sensor.ms_{name}",
+                    f'SELECT time, entity_id, value FROM "unit" WHERE "entity_id" = $entity_id_{i} '
+                    f'AND time >= $start_of_today ORDER BY time ASC', None)
+                   for i, name in enumerate(["temperature", "humidity", "co2"])]
+        bind_params = {"start_of_today": "2024-05-01T06:00:00Z",
+                       **{f"entity_id_{i}": sensor[2] for i, sensor in enumerate(sensors)}}
+
+        points = self.db.query_entity_history(sensors, bind_params)
+
+        self.assertEqual(points, [
+            [(21.0, "2024-05-01T07:00:00Z"), (22.0, "2024-05-01T08:00:00Z")],
+            [],
+            [(450.0, "2024-05-01T07:30:00Z")],
+        ])
+        self.assertEqual(self.db.query_entity_history(sensors[2:], bind_params),
+                         [[(450.0, "2024-05-01T07:30:00Z")]])
+
+    def test_query_entity_history_raises_for_a_failing_statement(self):
+        self.client.errors = {"sensor.ms_humidity"}
+        data = {"sensor.ms": {"sensors": {"Temperature": sensor_details("_temperature"),
+                                          "Humidity": sensor_details("_humidity")}}}
+
+        with self.assertRaises(InfluxDBClientError):
+            self.db.get_historic_sensor_data(data)
+
+    def test_later_updates_only_fetch_and_append_the_new_points(self):
+        self.client.points = {
+            "sensor.ms_temperature": [("2024-05-01T05:00:00Z", 19.0), ("2024-05-01T07:00:00Z", 21.0)],
+        }
+        data = {"sensor.ms": {"sensors": {"Temperature": sensor_details("_temperature")}}}
+        sensor = data["sensor.ms"]["sensors"]["Temperature"]
+
+        self.db.get_historic_sensor_data(data)
+        self.assertEqual(list(sensor["history"]), [(21.0, "2024-05-01T07:00:00Z")])
+        self.assertIn("time >= $start_of_today", self.client.statements[-1])
+
+        first_history = sensor["history"]
+        self.client.points["sensor.ms_temperature"].append(("2024-05-01T08:00:00Z", 22.0))
+        self.db.get_historic_sensor_data(data)
+
+        self.assertIn("time > $since_0", self.client.statements[-1])
+        self.assertEqual(list(sensor["history"]),
+                         [(21.0, "2024-05-01T07:00:00Z"), (22.0, "2024-05-01T08:00:00Z")])
+        # The history is replaced, never changed in place while the dashboard may be reading it
+        self.assertIsNot(sensor["history"], first_history)
+        self.assertEqual(list(first_history), [(21.0, "2024-05-01T07:00:00Z")])
+
+    def test_incremental_update_drops_the_points_before_today(self):
+        self.db._history_start = "2024-05-01T06:00:00Z"
+        self.db._last_point_time[("sensor.ms", "Temperature")] = "2024-05-01T07:00:00Z"
+        data = {"sensor.ms": {"sensors": {"Temperature": sensor_details("_temperature", [
+            (18.0, "2024-04-30T23:00:00Z"), (21.0, "2024-05-01T07:00:00Z")])}}}
+        self.client.points = {"sensor.ms_temperature": [("2024-05-01T08:00:00Z", 22.0)]}
+
+        self.db.get_historic_sensor_data(data)
+
+        self.assertEqual(list(data["sensor.ms"]["sensors"]["Temperature"]["history"]),
+                         [(21.0, "2024-05-01T07:00:00Z"), (22.0, "2024-05-01T08:00:00Z")])
+
+    def test_a_new_day_reselects_the_whole_day(self):
+        self.client.points = {"sensor.ms_temperature": [("2024-05-01T07:00:00Z", 21.0)]}
+        data = {"sensor.ms": {"sensors": {"Temperature": sensor_details("_temperature")}}}
+        self.db.get_historic_sensor_data(data)
+
+        self.now = datetime(2024, 5, 2, 12, 0)
+        self.client.points["sensor.ms_temperature"].append(("2024-05-02T07:00:00Z", 20.0))
+        self.db.get_historic_sensor_data(data)
+
+        self.assertIn("time >= $start_of_today", self.client.statements[-1])
+        self.assertEqual(list(data["sensor.ms"]["sensors"]["Temperature"]["history"]),
+                         [(20.0, "2024-05-02T07:00:00Z")])
+
+
+if __name__ == "__main__":
+    unittest.main()